@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -14,6 +15,8 @@ from github import GithubException
 from . import gitlab_utils as glu
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import github.GitRelease
     import github.Repository
     from gitlab import Gitlab
@@ -21,6 +24,12 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# GitLab upload reference: /uploads/<32-hex secret>/<filename>
+_ATTACHMENT_URL_RE = re.compile(r"/uploads/([a-f0-9]{32})/([^)\s]+)")
+
+# Maximum number of attachments downloaded from GitLab concurrently
+_MAX_DOWNLOAD_WORKERS = 8
+
 
 @dataclass(frozen=True)
 class DownloadedFile:
@@ -45,7 +54,6 @@ class DownloadResult:
     """Result of downloading files from GitLab."""
 
     files: list[DownloadedFile]
-    updated_content: str
     attachment_count: int
 
 
@@ -120,77 +128,91 @@ class AttachmentHandler:
             ProcessedContent with updated content and attachment count
         """
         download_result = self._download_files(content)
-        final_content = self._upload_files(download_result.files, download_result.updated_content, context)
+        self._upload_files(download_result.files, context)
+        final_content = self._replace_uploaded_urls(content) if download_result.attachment_count else content
         return ProcessedContent(content=final_content, attachment_count=download_result.attachment_count)
 
     def _download_files(self, content: str) -> DownloadResult:
-        """Find attachment URLs, download files, replace cached URLs.
+        """Find attachment URLs and download the files not uploaded yet.
+
+        Multiple attachments are downloaded concurrently; the returned files keep the order
+        in which they first appear in the content.
 
         Returns:
-            DownloadResult with files to upload, updated content, and attachment count
+            DownloadResult with files to upload and attachment count
         """
-        attachment_pattern = r"/uploads/([a-f0-9]{32})/([^)\s]+)"
-        attachments = re.findall(attachment_pattern, content)
+        attachments: list[tuple[str, str]] = _ATTACHMENT_URL_RE.findall(content)
 
         # Count total attachments referenced (including duplicates)
         self._total_attachments_referenced += len(attachments)
 
-        downloaded_files: list[DownloadedFile] = []
-        updated_content = content
+        to_download: dict[str, tuple[str, str]] = {}
 
         for secret, filename in attachments:
             short_url = f"/uploads/{secret}/{filename}"
 
-            # If already uploaded, just replace URL
+            # If already uploaded, the URL is replaced later on
             if short_url in self._uploaded_cache:
-                github_url = self._uploaded_cache[short_url]
-                updated_content = updated_content.replace(short_url, github_url)
-                logger.debug(f"Reusing cached attachment {filename}: {github_url}")
+                logger.debug(f"Reusing cached attachment {filename}: {self._uploaded_cache[short_url]}")
                 continue
 
-            full_url = f"{self._gitlab_project.web_url}{short_url}"
-            try:
-                attachment_content, content_type = glu.download_attachment(
-                    self._gitlab_client,
-                    self._gitlab_project,  # pyright: ignore[reportUnknownArgumentType]
-                    secret,
-                    filename,
-                )
-
-                if attachment_content:
-                    downloaded_files.append(
-                        DownloadedFile(
-                            filename=filename,
-                            content=attachment_content,
-                            short_gitlab_url=short_url,
-                            full_gitlab_url=full_url,
-                        )
-                    )
-                else:
-                    logger.warning(
-                        f"GitLab returned empty content for attachment {short_url} (Content-Type: {content_type})"
-                    )
-
-            except Exception as e:
-                logger.warning(f"Failed to download attachment {short_url}: {e}")
-
-        return DownloadResult(
-            files=downloaded_files, updated_content=updated_content, attachment_count=len(attachments)
+            to_download.setdefault(short_url, (secret, filename))
+
+        results: Iterable[DownloadedFile | None]
+        if len(to_download) <= 1:
+            # Most bodies reference at most one new attachment; no thread pool needed
+            results = [self._download_file(secret, filename) for secret, filename in to_download.values()]
+        else:
+            # Workers share the python-gitlab requests session: these are plain,
+            # independent GETs that mutate no client state (unlike the GraphQL client)
+            upload_secrets, filenames = zip(*to_download.values(), strict=True)
+            workers = min(_MAX_DOWNLOAD_WORKERS, len(to_download))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._download_file, upload_secrets, filenames))
+
+        downloaded_files = [f for f in results if f is not None]
+
+        return DownloadResult(files=downloaded_files, attachment_count=len(attachments))
+
+    def _download_file(self, secret: str, filename: str) -> DownloadedFile | None:
+        """Download a single attachment from GitLab.
+
+        Returns:
+            The downloaded file, or None if the download failed or returned no content
+        """
+        short_url = f"/uploads/{secret}/{filename}"
+        try:
+            attachment_content, content_type = glu.download_attachment(
+                self._gitlab_client,
+                self._gitlab_project,  # pyright: ignore[reportUnknownArgumentType]
+                secret,
+                filename,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to download attachment {short_url}: {e}")
+            return None
+
+        if not attachment_content:
+            logger.warning(f"GitLab returned empty content for attachment {short_url} (Content-Type: {content_type})")
+            return None
+
+        return DownloadedFile(
+            filename=filename,
+            content=attachment_content,
+            short_gitlab_url=short_url,
+            full_gitlab_url=f"{self._gitlab_project.web_url}{short_url}",
         )
 
-    def _upload_files(self, files: list[DownloadedFile], content: str, context: str) -> str:
-        """Upload files to GitHub release, update content with new URLs."""
+    def _upload_files(self, files: list[DownloadedFile], context: str) -> None:
+        """Upload files to GitHub release and record their new URLs."""
         if not files:
-            return content
+            return
 
-        updated_content = content
         release = self.attachments_release
 
         for file_info in files:
             # Skip if already cached
             if file_info.short_gitlab_url in self._uploaded_cache:
-                url = self._uploaded_cache[file_info.short_gitlab_url]
-                updated_content = updated_content.replace(file_info.short_gitlab_url, url)
                 continue
 
             # Skip empty files
@@ -216,7 +238,6 @@ class AttachmentHandler:
 
                 self._uploaded_cache[file_info.short_gitlab_url] = download_url
                 self._uploaded_files_count += 1
-                updated_content = updated_content.replace(file_info.short_gitlab_url, download_url)
                 logger.info(f"Uploaded {file_info.filename}: {download_url}")
 
             except GithubException, OSError:
@@ -228,4 +249,9 @@ class AttachmentHandler:
                     if p.exists():
                         p.unlink()
 
-        return updated_content
+    def _replace_uploaded_urls(self, content: str) -> str:
+        """Replace GitLab attachment URLs with their uploaded GitHub URLs in a single pass.
+
+        URLs that were not uploaded (e.g. failed downloads) are left unchanged.
+        """
+        return _ATTACHMENT_URL_RE.sub(lambda m: self._uploaded_cache.get(m.group(0), m.group(0)), content)
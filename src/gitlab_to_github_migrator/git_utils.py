@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import shutil
 import subprocess
 import tempfile
@@ -224,6 +225,23 @@ def count_unique_commits(clone_path: str) -> int:
 
 _GITLAB_HOSTS = ("gitlab.com", "www.gitlab.com")
 
+# One line of `git remote -v` output for a fetch URL: "<name>\t<url> (fetch)"
+_REMOTE_FETCH_LINE_RE = re.compile(r"^(\S+)\t(\S+) \(fetch\)$", re.MULTILINE)
+
+
+def _parse_fetch_remotes(remote_output: str) -> dict[str, str]:
+    """Parse ``git remote -v`` output into a mapping of remote name to fetch URL.
+
+    Push lines are ignored; each remote is listed once with its fetch URL.
+
+    Args:
+        remote_output: Standard output of ``git remote -v``.
+
+    Returns:
+        Mapping from remote name to fetch URL, in the order git listed them.
+    """
+    return {m.group(1): m.group(2) for m in _REMOTE_FETCH_LINE_RE.finditer(remote_output)}
+
 
 def _matches_gitlab_project(url: str, gitlab_project_path: str) -> bool:
     """Check whether a git remote URL refers to the given GitLab project on gitlab.com.
@@ -353,15 +371,7 @@ def update_remotes_after_migration(
         logger.debug("Failed to list git remotes - skipping remote update")
         return []
 
-    # Parse only the fetch lines: "<name>\t<url> (fetch)"
-    remotes: dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        if "(fetch)" in line:
-            parts = line.split("\t", 1)
-            if len(parts) == 2:
-                name = parts[0].strip()
-                url = parts[1].replace(" (fetch)", "").strip()
-                remotes[name] = url
+    remotes = _parse_fetch_remotes(result.stdout)
 
     updated: list[UpdatedRemote] = []
     for remote_name, remote_url in remotes.items():
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,10 +12,15 @@ if TYPE_CHECKING:
 # Minimum time difference (in seconds) to consider showing "last edited" timestamp
 LAST_EDITED_THRESHOLD_SECONDS = 60
 
+_UTC_OFFSET = dt.timedelta(0)
 
+
+@functools.lru_cache(maxsize=4096)
 def format_timestamp(iso_timestamp: str) -> str:
     """Format ISO 8601 timestamp to human-readable format.
 
+    Results are cached, as the same timestamps recur across an issue's notes.
+
     Args:
         iso_timestamp: ISO 8601 formatted timestamp string
 
@@ -26,12 +32,16 @@ def format_timestamp(iso_timestamp: str) -> str:
         return iso_timestamp
 
     try:
+        # fromisoformat() is C-implemented and accepts the "Z" suffix GitLab uses
         timestamp_dt = dt.datetime.fromisoformat(iso_timestamp)
-        formatted = timestamp_dt.isoformat(sep=" ", timespec="seconds")
-        return formatted.replace("+00:00", "Z")
     except ValueError, AttributeError:
         return iso_timestamp
 
+    formatted = timestamp_dt.isoformat(sep=" ", timespec="seconds")
+    if timestamp_dt.utcoffset() == _UTC_OFFSET:
+        return formatted.removesuffix("+00:00") + "Z"
+    return formatted
+
 
 def should_show_last_edited(created_at: str, updated_at: str) -> bool:
     """Check if last edited timestamp should be shown.
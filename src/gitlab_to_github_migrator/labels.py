@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
 from github import GithubException
 from gitlab.exceptions import GitlabError
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 
     from github.Repository import Repository as GithubRepository
     from gitlab.v4.objects import Project as GitlabProject
+    from gitlab.v4.objects import ProjectLabel as GitlabProjectLabel
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ def _is_already_exists_error(exc: GithubException) -> bool:
 
 
 class LabelTranslator:
-    """Handles label translation patterns."""
+    """Handles label translation patterns; the first matching pattern wins."""
 
     def __init__(self, patterns: Sequence[str] | None) -> None:
         self.patterns: list[tuple[str, str]] = []
@@ -45,17 +46,40 @@ class LabelTranslator:
             source, target = pattern.split(":", 1)
             self.patterns.append((source, target))
 
+        # Exact source -> (position, target); the earliest pattern for a source wins
+        self._exact: dict[str, tuple[int, str]] = {}
+        # Group name of each wildcard alternative -> (position, target)
+        self._wildcards: dict[str, tuple[int, str]] = {}
+        alternatives: list[str] = []
+        for position, (source, target) in enumerate(self.patterns):
+            if "*" not in source:
+                self._exact.setdefault(source, (position, target))
+                continue
+            # The first "*" is captured and substituted into the target
+            first, *rest = (re.escape(part) for part in source.split("*"))
+            alternatives.append(f"(?P<p{position}>{first}(?P<w{position}>.*){'.*'.join(rest)})")
+            self._wildcards[f"p{position}"] = (position, target)
+        # All wildcard patterns in one alternation, tried in pattern order
+        self._wildcard_re: re.Pattern[str] | None = re.compile("|".join(alternatives)) if alternatives else None
+        self._cache: dict[str, str] = {}
+
     def translate(self, label_name: str) -> str:
         """Translate a label name using configured patterns."""
-        for source_pattern, target_pattern in self.patterns:
-            if "*" in source_pattern:
-                # Convert glob pattern to regex
-                regex_pattern = source_pattern.replace("*", "(.*)")
-                match = re.match(f"^{regex_pattern}$", label_name)
-                if match:
-                    return target_pattern.replace("*", match.group(1))
-            elif source_pattern == label_name:
-                return target_pattern
+        translated = self._cache.get(label_name)
+        if translated is None:
+            translated = self._cache[label_name] = self._translate_uncached(label_name)
+        return translated
+
+    def _translate_uncached(self, label_name: str) -> str:
+        """Translate a label name without consulting the memo."""
+        exact = self._exact.get(label_name)
+        match = self._wildcard_re.fullmatch(label_name) if self._wildcard_re else None
+        if match is not None and match.lastgroup is not None:
+            position, target = self._wildcards[match.lastgroup]
+            if exact is None or position < exact[0]:
+                return target.replace("*", match.group(f"w{position}"))
+        if exact is not None:
+            return exact[1]
         return label_name
 
 
@@ -72,6 +96,8 @@ def migrate_labels(
     gitlab_project: GitlabProject,
     github_repo: GithubRepository,
     label_translations: Sequence[str] | None = None,
+    *,
+    gitlab_labels: Sequence[GitlabProjectLabel] | None = None,
 ) -> LabelMigrationResult:
     """Migrate and translate labels from GitLab to GitHub.
 
@@ -83,6 +109,7 @@ def migrate_labels(
         gitlab_project: The GitLab project to migrate labels from
         github_repo: The GitHub repository to migrate labels to
         label_translations: Optional list of translation patterns ("source:target")
+        gitlab_labels: Labels already fetched from the GitLab project (fetched if not given)
 
     Returns:
         LabelMigrationResult with label_mapping and initial_github_labels
@@ -100,7 +127,8 @@ def migrate_labels(
         initial_github_labels: dict[str, str] = {label.name.lower(): label.name for label in github_repo.get_labels()}
 
         # Get GitLab labels
-        gitlab_labels: list[Any] = gitlab_project.labels.list(get_all=True)
+        if gitlab_labels is None:
+            gitlab_labels = gitlab_project.labels.list(get_all=True)
 
         for gitlab_label in gitlab_labels:
             # Translate label name
@@ -8,6 +8,7 @@ import datetime as dt
 import logging
 import subprocess
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import github.Issue
@@ -26,12 +27,28 @@ from .gitlab_utils import get_normal_issue_cross_links
 from .issue_builder import build_issue_body, format_timestamp, should_show_last_edited
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from gitlab.v4.objects import Project as GitlabProject
     from gitlab.v4.objects import ProjectIssue as GitlabProjectIssue
+    from gitlab.v4.objects import ProjectLabel as GitlabProjectLabel
+    from gitlab.v4.objects import ProjectMilestone as GitlabProjectMilestone
 
 # Module-wide logger
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Title of the milestones created to fill numbering gaps; validation skips milestones with this title
+_PLACEHOLDER_MILESTONE_TITLE = "Placeholder Milestone"
+
+# create_milestone() parameters shared by all placeholder milestones (read-only, as they are reused)
+_PLACEHOLDER_MILESTONE_PARAMS: Mapping[str, Any] = MappingProxyType(
+    {
+        "title": _PLACEHOLDER_MILESTONE_TITLE,
+        "state": "closed",
+        "description": "Placeholder to preserve milestone numbering",
+    }
+)
+
 
 @dataclass
 class MigratedIssue:
@@ -90,6 +107,11 @@ class GitlabToGithubMigrator:
         self._github_repo: github.Repository.Repository | None = None
         self._attachment_handler: AttachmentHandler | None = None
 
+        # GitLab collections, fetched once and shared by migration and validation
+        self._gitlab_labels: list[GitlabProjectLabel] | None = None
+        self._gitlab_milestones: list[GitlabProjectMilestone] | None = None
+        self._gitlab_issues: list[GitlabProjectIssue] | None = None
+
         # Store label translations for later use
         self._label_translations: list[str] | None = label_translations
 
@@ -131,6 +153,27 @@ class GitlabToGithubMigrator:
             )
         return self._attachment_handler
 
+    @property
+    def gitlab_labels(self) -> list[GitlabProjectLabel]:
+        """Get all labels of the GitLab project (cached)."""
+        if self._gitlab_labels is None:
+            self._gitlab_labels = self.gitlab_project.labels.list(get_all=True)
+        return self._gitlab_labels
+
+    @property
+    def gitlab_milestones(self) -> list[GitlabProjectMilestone]:
+        """Get all milestones of the GitLab project, in any state (cached)."""
+        if self._gitlab_milestones is None:
+            self._gitlab_milestones = self.gitlab_project.milestones.list(get_all=True, state="all")
+        return self._gitlab_milestones
+
+    @property
+    def gitlab_issues(self) -> list[GitlabProjectIssue]:
+        """Get all issues of the GitLab project, in any state (cached)."""
+        if self._gitlab_issues is None:
+            self._gitlab_issues = self.gitlab_project.issues.list(get_all=True, state="all")
+        return self._gitlab_issues
+
     def validate_api_access(self) -> None:
         """Validate GitLab and GitHub API access."""
         try:
@@ -177,6 +220,7 @@ class GitlabToGithubMigrator:
             self.gitlab_project,
             self.github_repo,
             self._label_translations,
+            gitlab_labels=self.gitlab_labels,
         )
         self.label_mapping = result.label_mapping
         self.initial_github_labels = result.initial_github_labels
@@ -184,8 +228,7 @@ class GitlabToGithubMigrator:
     def migrate_milestones_with_number_preservation(self) -> None:
         """Migrate milestones while preserving GitLab milestone numbers."""
         # Get all GitLab milestones sorted by ID
-        gitlab_milestones = self.gitlab_project.milestones.list(get_all=True, state="all")
-        gitlab_milestones.sort(key=lambda m: m.iid)
+        gitlab_milestones = sorted(self.gitlab_milestones, key=lambda m: m.iid)
 
         if not gitlab_milestones:
             print("No milestones to migrate")
@@ -194,54 +237,64 @@ class GitlabToGithubMigrator:
         print("Migrating milestones...")
         max_milestone_number = gitlab_milestones[-1].iid  # This works because sorted by iid
         gitlab_milestone_map = {m.iid: m for m in gitlab_milestones}
+
+        # Plan every creation up front: GitHub numbers milestones sequentially, so they must be created in
+        # order, but preparing the parameters first means malformed GitLab data fails before anything is created.
+        plan: list[tuple[int, GitlabProjectMilestone | None, Mapping[str, Any]]] = []
+        for number in range(1, max_milestone_number + 1):
+            gitlab_milestone = gitlab_milestone_map.get(number)
+            params = (
+                self._milestone_params(gitlab_milestone)
+                if gitlab_milestone is not None
+                else _PLACEHOLDER_MILESTONE_PARAMS
+            )
+            plan.append((number, gitlab_milestone, params))
+
         placeholder_milestones: list[github.Milestone.Milestone] = []
 
         # Create milestones maintaining number sequence
-        for milestone_number in range(1, max_milestone_number + 1):
-            if milestone_number in gitlab_milestone_map:
-                # Real milestone exists
-                gitlab_milestone = gitlab_milestone_map[milestone_number]
-
-                # Create milestone parameters, only include due_on if it exists
-                milestone_params = {
-                    "title": gitlab_milestone.title,
-                    "state": "open" if gitlab_milestone.state == "active" else "closed",
-                    "description": gitlab_milestone.description or "",
-                }
-                if gitlab_milestone.due_date:
-                    milestone_params["due_on"] = dt.datetime.strptime(gitlab_milestone.due_date, "%Y-%m-%d").date()  # noqa: DTZ007
-
-                github_milestone = self.github_repo.create_milestone(**milestone_params)  # pyright: ignore[reportArgumentType]
+        for milestone_number, gitlab_milestone, milestone_params in plan:
+            github_milestone = self.github_repo.create_milestone(**milestone_params)
 
+            if gitlab_milestone is not None:
                 # Verify milestone number
                 if github_milestone.number != milestone_number:
                     msg = f"Milestone number mismatch: expected {milestone_number}, got {github_milestone.number}"
                     raise NumberVerificationError(msg)
 
-                self.milestone_mapping[gitlab_milestone.id] = github_milestone.number
                 logger.info(f"Created milestone #{milestone_number}: {gitlab_milestone.title}")
             else:
-                # Create placeholder milestone
-                placeholder_milestone = self.github_repo.create_milestone(
-                    title="Placeholder Milestone",
-                    state="closed",
-                    description="Placeholder to preserve milestone numbering",
-                )
-
                 # Verify placeholder number
-                if placeholder_milestone.number != milestone_number:
-                    msg = f"Placeholder milestone number mismatch: expected {milestone_number}, got {placeholder_milestone.number}"
+                if github_milestone.number != milestone_number:
+                    msg = f"Placeholder milestone number mismatch: expected {milestone_number}, got {github_milestone.number}"
                     raise NumberVerificationError(msg)
 
                 logger.debug(f"Created placeholder milestone #{milestone_number}")
-                placeholder_milestones.append(placeholder_milestone)
+                placeholder_milestones.append(github_milestone)
 
         for milestone in placeholder_milestones:
             milestone.delete()
             logger.debug(f"Deleted placeholder milestone #{milestone.number}")
 
+        # Every number was verified above, so the mapping follows directly from the plan
+        self.milestone_mapping = {
+            gitlab_milestone.id: number for number, gitlab_milestone, _ in plan if gitlab_milestone is not None
+        }
         print(f"Migrated {len(self.milestone_mapping)} milestones")
 
+    @staticmethod
+    def _milestone_params(gitlab_milestone: GitlabProjectMilestone) -> dict[str, Any]:
+        """Build the GitHub create_milestone() parameters for a GitLab milestone."""
+        # Only include due_on if the GitLab milestone has a due date
+        milestone_params: dict[str, Any] = {
+            "title": gitlab_milestone.title,
+            "state": "open" if gitlab_milestone.state == "active" else "closed",
+            "description": gitlab_milestone.description or "",
+        }
+        if gitlab_milestone.due_date:
+            milestone_params["due_on"] = dt.datetime.strptime(gitlab_milestone.due_date, "%Y-%m-%d").date()  # noqa: DTZ007
+        return milestone_params
+
     def _create_migrated_issue(
         self,
         gitlab_issue: GitlabProjectIssue,
@@ -440,7 +493,7 @@ class GitlabToGithubMigrator:
 
     def migrate_issues_with_number_preservation(self) -> None:
         """Migrate issues while preserving GitLab issue numbers."""
-        gitlab_issues = self.gitlab_project.issues.list(get_all=True, state="all")
+        gitlab_issues = self.gitlab_issues
         if not gitlab_issues:
             print("No issues to migrate")
             return
@@ -571,17 +624,17 @@ class GitlabToGithubMigrator:
     def _collect_gitlab_statistics(self) -> dict[str, int]:
         """Collect statistics from GitLab."""
         # Count issues with state breakdown
-        gitlab_issues = self.gitlab_project.issues.list(get_all=True, state="all")
+        gitlab_issues = self.gitlab_issues
         gitlab_issues_open = [i for i in gitlab_issues if i.state == "opened"]
         gitlab_issues_closed = [i for i in gitlab_issues if i.state == "closed"]
 
         # Count milestones with state breakdown
-        gitlab_milestones = self.gitlab_project.milestones.list(get_all=True, state="all")
+        gitlab_milestones = self.gitlab_milestones
         gitlab_milestones_open = [m for m in gitlab_milestones if m.state == "active"]
         gitlab_milestones_closed = [m for m in gitlab_milestones if m.state == "closed"]
 
         # Count labels
-        gitlab_labels = self.gitlab_project.labels.list(get_all=True)
+        gitlab_labels = self.gitlab_labels
 
         # Count git repository items using git CLI (efficient)
         if self._git_clone_path:
@@ -618,7 +671,7 @@ class GitlabToGithubMigrator:
 
         # Count milestones with state breakdown
         github_milestones_all = list(self.github_repo.get_milestones(state="all"))
-        github_milestones = [m for m in github_milestones_all if m.title != "Placeholder Milestone"]
+        github_milestones = [m for m in github_milestones_all if m.title != _PLACEHOLDER_MILESTONE_TITLE]
         github_milestones_open = [m for m in github_milestones if m.state == "open"]
         github_milestones_closed = [m for m in github_milestones if m.state == "closed"]
 
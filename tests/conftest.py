@@ -4,18 +4,27 @@ Pytest configuration and fixtures.
 This module configures pytest behavior for different test types:
 - Integration tests: Fail on any warnings from the code under test
 - Unit tests: Allow warnings (for backwards compatibility)
+
+It also provides the mocked GitLab/GitHub clients, project, repository and
+migrator fixtures shared by the unit tests.
 """
 
 from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, Any, override
+from unittest.mock import Mock
 
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+
+    from gitlab_to_github_migrator import GitlabToGithubMigrator
+
+GITLAB_PROJECT_PATH = "test-org/test-project"
+GITHUB_REPO_PATH = "github-org/test-repo"
 
 # Store warning records during test execution
 _integration_test_warnings: dict[str, list[logging.LogRecord]] = {}
@@ -171,3 +180,64 @@ def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) ->
 
         # Clean up the warnings for this test
         _integration_test_warnings.pop(test_nodeid, None)
+
+
+@pytest.fixture
+def mock_gitlab_client(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """GitLab client returned by gitlab_utils.get_client()."""
+    client = Mock()
+    monkeypatch.setattr("gitlab_to_github_migrator.gitlab_utils.Gitlab", Mock(return_value=client))
+    return client
+
+
+@pytest.fixture
+def mock_github_client(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """GitHub client returned by github_utils.get_client()."""
+    client = Mock()
+    monkeypatch.setattr("gitlab_to_github_migrator.github_utils.Github", Mock(return_value=client))
+    return client
+
+
+@pytest.fixture
+def mock_gitlab_project(mock_gitlab_client: Mock) -> Mock:
+    """GitLab project returned by the mocked GitLab client."""
+    project = Mock(
+        id=12345,
+        description="Test project description",
+        web_url="https://gitlab.com/test-org/test-project",
+        ssh_url_to_repo="git@gitlab.com:test-org/test-project.git",
+    )
+    # "name" is a Mock constructor argument, so it has to be configured separately
+    project.configure_mock(name="test-project")
+    mock_gitlab_client.projects.get.return_value = project
+    return project
+
+
+@pytest.fixture
+def mock_github_repo() -> Mock:
+    """GitHub repository the migrator works on."""
+    return Mock(html_url="https://github.com/github-org/test-repo", ssh_url="git@github.com:github-org/test-repo.git")
+
+
+@pytest.fixture
+def make_migrator(mock_gitlab_project: Mock, mock_github_repo: Mock) -> Callable[..., GitlabToGithubMigrator]:
+    """Factory building migrators wired to the mocked GitLab project and GitHub repository.
+
+    Keyword arguments are passed on to GitlabToGithubMigrator.
+    """
+    # Imported here so this conftest stays loadable on its own (see test_env_var_validation.py)
+    from gitlab_to_github_migrator import GitlabToGithubMigrator
+
+    def factory(**kwargs: Any) -> GitlabToGithubMigrator:
+        migrator = GitlabToGithubMigrator(GITLAB_PROJECT_PATH, GITHUB_REPO_PATH, github_token="test_token", **kwargs)
+        assert migrator.gitlab_project is mock_gitlab_project
+        migrator.github_repo = mock_github_repo
+        return migrator
+
+    return factory
+
+
+@pytest.fixture
+def migrator(make_migrator: Callable[..., GitlabToGithubMigrator]) -> GitlabToGithubMigrator:
+    """Migrator wired to the mocked GitLab project and GitHub repository."""
+    return make_migrator()
@@ -1,9 +1,10 @@
 """Tests for attachment handling."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
+from gitlab_to_github_migrator import attachments
 from gitlab_to_github_migrator.attachments import AttachmentHandler, DownloadedFile, ProcessedContent
 
 
@@ -20,22 +21,23 @@ class TestDownloadedFile:
         assert f.content == b"image data"
 
 
+@pytest.fixture
+def handler(mock_gitlab_client: Mock, mock_gitlab_project: Mock, mock_github_repo: Mock) -> AttachmentHandler:
+    """Attachment handler using the shared GitLab/GitHub mocks."""
+    return AttachmentHandler(mock_gitlab_client, mock_gitlab_project, mock_github_repo)
+
+
+@pytest.fixture
+def mock_download(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace GitLab attachment downloads with a mock."""
+    download = Mock()
+    monkeypatch.setattr("gitlab_to_github_migrator.attachments.glu.download_attachment", download)
+    return download
+
+
 @pytest.mark.unit
 class TestAttachmentHandler:
-    def setup_method(self) -> None:
-        self.mock_gitlab_client: Mock = Mock()
-        self.mock_gitlab_project: Mock = Mock()
-        self.mock_gitlab_project.id = 12345
-        self.mock_gitlab_project.web_url = "https://gitlab.com/org/project"
-        self.mock_github_repo: Mock = Mock()
-
-    def test_process_content_no_attachments(self) -> None:
-        handler = AttachmentHandler(
-            self.mock_gitlab_client,
-            self.mock_gitlab_project,
-            self.mock_github_repo,
-        )
-
+    def test_process_content_no_attachments(self, handler: AttachmentHandler) -> None:
         content = "No attachments here"
         result = handler.process_content(content)
 
@@ -43,13 +45,7 @@ class TestAttachmentHandler:
         assert result.content == content
         assert result.attachment_count == 0
 
-    def test_process_content_with_cached_attachment(self) -> None:
-        handler = AttachmentHandler(
-            self.mock_gitlab_client,
-            self.mock_gitlab_project,
-            self.mock_github_repo,
-        )
-
+    def test_process_content_with_cached_attachment(self, handler: AttachmentHandler) -> None:
         # Pre-populate cache
         handler._uploaded_cache["/uploads/abcdef0123456789abcdef0123456789/cached.pdf"] = (
             "https://github.com/releases/cached.pdf"
@@ -63,8 +59,9 @@ class TestAttachmentHandler:
         assert "https://github.com/releases/cached.pdf" in result.content
         assert result.attachment_count == 1
 
-    @patch("gitlab_to_github_migrator.attachments.glu.download_attachment")
-    def test_process_content_downloads_and_uploads(self, mock_download) -> None:
+    def test_process_content_downloads_and_uploads(
+        self, handler: AttachmentHandler, mock_download: Mock, mock_github_repo: Mock
+    ) -> None:
         # Setup download mock
         mock_download.return_value = (b"file content", "application/pdf")
 
@@ -73,15 +70,9 @@ class TestAttachmentHandler:
         mock_asset = Mock()
         mock_asset.browser_download_url = "https://github.com/releases/download/file.pdf"
         mock_release.upload_asset.return_value = mock_asset
-        self.mock_github_repo.get_releases.return_value = [mock_release]
+        mock_github_repo.get_releases.return_value = [mock_release]
         mock_release.name = "GitLab issue attachments"
 
-        handler = AttachmentHandler(
-            self.mock_gitlab_client,
-            self.mock_gitlab_project,
-            self.mock_github_repo,
-        )
-
         content = "File: /uploads/abcdef0123456789abcdef0123456789/doc.pdf"
         result = handler.process_content(content, context="issue #1")
 
@@ -90,8 +81,9 @@ class TestAttachmentHandler:
         assert "https://github.com/releases/download/file.pdf" in result.content
         assert result.attachment_count == 1
 
-    @patch("gitlab_to_github_migrator.attachments.glu.download_attachment")
-    def test_attachment_counters(self, mock_download) -> None:
+    def test_attachment_counters(
+        self, handler: AttachmentHandler, mock_download: Mock, mock_github_repo: Mock
+    ) -> None:
         """Test that attachment counters track uploaded files and total references correctly."""
         # Setup download mock
         mock_download.return_value = (b"file content", "application/pdf")
@@ -101,15 +93,9 @@ class TestAttachmentHandler:
         mock_asset = Mock()
         mock_asset.browser_download_url = "https://github.com/releases/download/file.pdf"
         mock_release.upload_asset.return_value = mock_asset
-        self.mock_github_repo.get_releases.return_value = [mock_release]
+        mock_github_repo.get_releases.return_value = [mock_release]
         mock_release.name = "GitLab issue attachments"
 
-        handler = AttachmentHandler(
-            self.mock_gitlab_client,
-            self.mock_gitlab_project,
-            self.mock_github_repo,
-        )
-
         # Initially counters should be zero
         assert handler.uploaded_files_count == 0
         assert handler.total_attachments_referenced == 0
@@ -141,3 +127,65 @@ class TestAttachmentHandler:
         # Should have 2 uploads (one new) and 4 references total (2 from content3 + 2 from before)
         assert handler.uploaded_files_count == 2
         assert handler.total_attachments_referenced == 4
+
+    def test_download_files_keeps_discovery_order(self, handler: AttachmentHandler, mock_download: Mock) -> None:
+        """Attachments are downloaded once each and returned in the order they appear."""
+        mock_download.side_effect = lambda _client, _project, secret, filename: (
+            f"{secret}/{filename}".encode(),
+            "text/plain",
+        )
+
+        upload_secrets = [f"{i:032x}" for i in range(1, 5)]
+        content = " ".join(f"/uploads/{secret}/file{i}.txt" for i, secret in enumerate(upload_secrets))
+        # Repeat the first attachment: it must not be downloaded twice
+        content += f" /uploads/{upload_secrets[0]}/file0.txt"
+
+        result = handler._download_files(content)
+
+        assert mock_download.call_count == 4
+        assert [f.filename for f in result.files] == ["file0.txt", "file1.txt", "file2.txt", "file3.txt"]
+        assert [f.content for f in result.files] == [f"{s}/file{i}.txt".encode() for i, s in enumerate(upload_secrets)]
+        assert result.attachment_count == 5
+
+    def test_single_download_skips_thread_pool(
+        self, handler: AttachmentHandler, mock_download: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A single new attachment is downloaded inline, without starting worker threads."""
+        mock_download.return_value = (b"data", "text/plain")
+        mock_executor = Mock()
+        monkeypatch.setattr(attachments, "ThreadPoolExecutor", mock_executor)
+
+        result = handler._download_files(f"/uploads/{1:032x}/file.txt")
+
+        mock_executor.assert_not_called()
+        assert [f.filename for f in result.files] == ["file.txt"]
+
+    def test_many_cached_attachments_in_large_body(self, handler: AttachmentHandler) -> None:
+        """Rewriting many cached URLs in one pass gives the same result as replacing them one by one."""
+        short_urls = [f"/uploads/{i:032x}/file{i}.png" for i in range(50)]
+        for i, short_url in enumerate(short_urls):
+            handler._uploaded_cache[short_url] = f"https://github.com/releases/download/file{i}.png"
+
+        paragraph = " ".join(f"![f{i}]({short_url})" for i, short_url in enumerate(short_urls))
+        content = "\n\n".join([paragraph] * (100_000 // len(paragraph) + 1))
+
+        expected = content
+        for short_url, github_url in handler._uploaded_cache.items():
+            expected = expected.replace(short_url, github_url)
+
+        assert len(content) >= 100_000
+        assert handler._replace_uploaded_urls(content) == expected
+
+    def test_failed_download_keeps_original_url(self, handler: AttachmentHandler, mock_download: Mock) -> None:
+        """Only uploaded attachments are rewritten; others keep their GitLab URL."""
+        handler._uploaded_cache["/uploads/abcdef0123456789abcdef0123456789/a.png"] = "https://github.com/a.png"
+
+        content = (
+            "![a](/uploads/abcdef0123456789abcdef0123456789/a.png) "
+            "![b](/uploads/fedcba9876543210fedcba9876543210/b.png)"
+        )
+        mock_download.side_effect = OSError("unreachable")
+        result = handler.process_content(content)
+
+        assert result.content == "![a](https://github.com/a.png) ![b](/uploads/fedcba9876543210fedcba9876543210/b.png)"
+        assert result.attachment_count == 2
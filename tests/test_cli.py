@@ -105,6 +105,55 @@ class TestPrintValidationReport:
         captured = capsys.readouterr()
         assert "test-org/test-project" in captured.out
 
+    def test_report_snapshot(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the exact report text."""
+        report = {
+            "gitlab_project": "test-org/test-project",
+            "github_repo": "github-org/test-repo",
+            "success": False,
+            "errors": ["Issue count mismatch: GitLab 2, GitHub 1"],
+            "statistics": {"gitlab_issues_total": 2, "github_issues_total": 1, "comments_migrated": 4},
+        }
+
+        _print_validation_report(report)
+
+        assert capsys.readouterr().out == (
+            "\n" + "=" * 80 + "\nMIGRATION VALIDATION REPORT\n" + "=" * 80 + "\n\n"
+            "GitLab Project: test-org/test-project\n"
+            "GitHub Repository: github-org/test-repo\n"
+            "\n"
+            "✗ Validation Status: FAILED\n"
+            "\n"
+            "ERRORS:\n"
+            "  • Issue count mismatch: GitLab 2, GitHub 1\n"
+            "\n"
+            "MIGRATION STATISTICS:\n"
+            "\n"
+            "Git Repository:\n"
+            "  GitLab:  Branches=0, Tags=0, Commits=0\n"
+            "  GitHub:  Branches=0, Tags=0, Commits=0\n"
+            "\n"
+            "Labels:\n"
+            "  GitLab:  Total=0\n"
+            "  GitHub:  Existing=0, Created=0, Translated=0\n"
+            "\n"
+            "Milestones:\n"
+            "  GitLab:  Total=0, Open=0, Closed=0\n"
+            "  GitHub:  Total=0, Open=0, Closed=0\n"
+            "\n"
+            "Issues:\n"
+            "  GitLab:  Total=2, Open=0, Closed=0\n"
+            "  GitHub:  Total=1, Open=0, Closed=0\n"
+            "\n"
+            "Comments:\n"
+            "  Migrated: 4\n"
+            "\n"
+            "Attachments:\n"
+            "  Uploaded files: 0\n"
+            "  Total references: 0\n"
+            "\n" + "=" * 80 + "\n"
+        )
+
 
 @pytest.mark.unit
 class TestSetupLogging:
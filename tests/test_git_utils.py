@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import subprocess
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -16,6 +16,7 @@ from gitlab_to_github_migrator.git_utils import (
     _build_github_url,
     _get_backup_remote_name,
     _matches_gitlab_project,
+    _parse_fetch_remotes,
     update_remotes_after_migration,
 )
 
@@ -67,6 +68,30 @@ class TestMatchesGitLabProject:
         assert _matches_gitlab_project("https://gitlab.com/ns/repo.git", "ns/repo/")
 
 
+@pytest.mark.unit
+class TestParseFetchRemotes:
+    """Tests for _parse_fetch_remotes()."""
+
+    def test_fetch_and_push_lines(self) -> None:
+        output = (
+            "origin\thttps://gitlab.com/ns/repo.git (fetch)\n"
+            "origin\thttps://gitlab.com/ns/repo.git (push)\n"
+            "upstream\tgit@gitlab.com:ns/other.git (fetch)\n"
+            "upstream\tgit@gitlab.com:ns/other.git (push)\n"
+        )
+        assert _parse_fetch_remotes(output) == {
+            "origin": "https://gitlab.com/ns/repo.git",
+            "upstream": "git@gitlab.com:ns/other.git",
+        }
+
+    def test_push_only_url_is_ignored(self) -> None:
+        output = "origin\thttps://gitlab.com/ns/repo.git (fetch)\norigin\thttps://github.com/o/r.git (push)\n"
+        assert _parse_fetch_remotes(output) == {"origin": "https://gitlab.com/ns/repo.git"}
+
+    def test_empty_output(self) -> None:
+        assert _parse_fetch_remotes("") == {}
+
+
 @pytest.mark.unit
 class TestBuildGithubUrl:
     """Tests for _build_github_url()."""
@@ -123,22 +148,21 @@ class TestUpdateRemotesAfterMigration:
         mock.side_effect = side_effect
         return mock
 
-    def test_not_in_git_repo_returns_empty(self) -> None:
-        with patch("gitlab_to_github_migrator.git_utils.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1)
-            result = update_remotes_after_migration("ns/repo", "owner/newrepo")
+    def test_not_in_git_repo_returns_empty(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(subprocess, "run", MagicMock(return_value=MagicMock(returncode=1)))
+        result = update_remotes_after_migration("ns/repo", "owner/newrepo")
         assert result == []
 
-    def test_no_matching_remote_returns_empty(self) -> None:
+    def test_no_matching_remote_returns_empty(self, monkeypatch: pytest.MonkeyPatch) -> None:
         remotes = "origin\thttps://github.com/someone/other.git (fetch)\n"
-        with patch("gitlab_to_github_migrator.git_utils.subprocess.run", self._make_run(remotes)):
-            result = update_remotes_after_migration("ns/repo", "owner/newrepo")
+        monkeypatch.setattr(subprocess, "run", self._make_run(remotes))
+        result = update_remotes_after_migration("ns/repo", "owner/newrepo")
         assert result == []
 
-    def test_origin_remote_https_is_updated(self) -> None:
+    def test_origin_remote_https_is_updated(self, monkeypatch: pytest.MonkeyPatch) -> None:
         remotes = "origin\thttps://gitlab.com/ns/repo.git (fetch)\n"
-        with patch("gitlab_to_github_migrator.git_utils.subprocess.run", self._make_run(remotes)):
-            result = update_remotes_after_migration("ns/repo", "owner/newrepo")
+        monkeypatch.setattr(subprocess, "run", self._make_run(remotes))
+        result = update_remotes_after_migration("ns/repo", "owner/newrepo")
 
         assert result == [
             UpdatedRemote(
@@ -149,32 +173,32 @@ class TestUpdateRemotesAfterMigration:
             )
         ]
 
-    def test_origin_remote_ssh_is_updated_as_ssh(self) -> None:
+    def test_origin_remote_ssh_is_updated_as_ssh(self, monkeypatch: pytest.MonkeyPatch) -> None:
         remotes = "origin\tgit@gitlab.com:ns/repo.git (fetch)\n"
-        with patch("gitlab_to_github_migrator.git_utils.subprocess.run", self._make_run(remotes)):
-            result = update_remotes_after_migration("ns/repo", "owner/newrepo")
+        monkeypatch.setattr(subprocess, "run", self._make_run(remotes))
+        result = update_remotes_after_migration("ns/repo", "owner/newrepo")
 
         assert len(result) == 1
         assert result[0].new_url == "git@github.com:owner/newrepo.git"
 
-    def test_non_origin_remote_gets_gitlab_suffix(self) -> None:
+    def test_non_origin_remote_gets_gitlab_suffix(self, monkeypatch: pytest.MonkeyPatch) -> None:
         remotes = "upstream\thttps://gitlab.com/ns/repo.git (fetch)\n"
-        with patch("gitlab_to_github_migrator.git_utils.subprocess.run", self._make_run(remotes)):
-            result = update_remotes_after_migration("ns/repo", "owner/newrepo")
+        monkeypatch.setattr(subprocess, "run", self._make_run(remotes))
+        result = update_remotes_after_migration("ns/repo", "owner/newrepo")
 
         assert len(result) == 1
         assert result[0].backup_name == "upstream-gitlab"
 
-    def test_backup_remote_add_called_with_old_url(self) -> None:
+    def test_backup_remote_add_called_with_old_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
         remotes = "origin\thttps://gitlab.com/ns/repo.git (fetch)\n"
         calls_made: list[list[str]] = []
 
-        def side_effect(cmd: list[str], **_kwargs: object) -> MagicMock:
+        def fake_run(cmd: list[str], **_kwargs: object) -> MagicMock:
             calls_made.append(list(cmd))
             return MagicMock(returncode=0, stdout=remotes if cmd[1:3] == ["remote", "-v"] else "")
 
-        with patch("gitlab_to_github_migrator.git_utils.subprocess.run", side_effect=side_effect):
-            update_remotes_after_migration("ns/repo", "owner/newrepo")
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        update_remotes_after_migration("ns/repo", "owner/newrepo")
 
         # The "remote add" call should use the old GitLab URL
         add_calls = [c for c in calls_made if c[1:3] == ["remote", "add"]]
@@ -192,16 +216,16 @@ class TestUpdateRemotesAfterMigration:
             "https://github.com/owner/newrepo.git",
         ]
 
-    def test_cwd_is_passed_to_subprocess(self) -> None:
+    def test_cwd_is_passed_to_subprocess(self, monkeypatch: pytest.MonkeyPatch) -> None:
         remotes = "origin\thttps://gitlab.com/ns/repo.git (fetch)\n"
         cwd_used: list[str | None] = []
 
-        def side_effect(cmd: list[str], **kwargs: object) -> MagicMock:
+        def fake_run(cmd: list[str], **kwargs: object) -> MagicMock:
             cwd_used.append(str(kwargs.get("cwd")))
             return MagicMock(returncode=0, stdout=remotes if cmd[1:3] == ["remote", "-v"] else "")
 
-        with patch("gitlab_to_github_migrator.git_utils.subprocess.run", side_effect=side_effect):
-            update_remotes_after_migration("ns/repo", "owner/newrepo", cwd="/some/path")
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        update_remotes_after_migration("ns/repo", "owner/newrepo", cwd="/some/path")
 
         assert all(c == "/some/path" for c in cwd_used)
 
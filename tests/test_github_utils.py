@@ -2,13 +2,24 @@
 Tests for GitHub utilities module.
 """
 
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 from github import GithubException
 
 from gitlab_to_github_migrator import MigrationError
-from gitlab_to_github_migrator.github_utils import create_repo, set_default_branch
+from gitlab_to_github_migrator.github_utils import (
+    create_issue_dependency,
+    create_repo,
+    delete_issue,
+    set_default_branch,
+)
+
+_NOT_FOUND = GithubException(404, "Branch not found", None)
+_ALREADY_EXISTS = GithubException(422, {"message": "Already exists"}, None)
+_VALIDATION_FAILED = GithubException(422, {"message": "Validation Failed"}, None)
+_SERVER_ERROR = GithubException(500, "Server Error", None)
 
 
 @pytest.mark.unit
@@ -25,11 +36,12 @@ class TestSetDefaultBranch:
 
         mock_repo.edit.assert_called_once_with(default_branch="develop")
 
-    def test_set_default_branch_github_error(self) -> None:
+    @pytest.mark.parametrize("error", [_NOT_FOUND, _VALIDATION_FAILED, _SERVER_ERROR], ids=["404", "422", "500"])
+    def test_set_default_branch_github_error(self, error: GithubException) -> None:
         """Test that set_default_branch raises MigrationError on GitHub API error."""
         mock_repo = Mock()
         mock_repo.full_name = "owner/repo"
-        mock_repo.edit = Mock(side_effect=GithubException(404, "Branch not found", None))
+        mock_repo.edit = Mock(side_effect=error)
 
         with pytest.raises(MigrationError, match=r"Failed to set default branch to 'nonexistent'"):
             set_default_branch(mock_repo, "nonexistent")
@@ -137,5 +149,80 @@ class TestCreateRepo:
         assert args.kwargs["name"] == "myrepo"
 
 
+@pytest.mark.unit
+class TestCreateIssueDependency:
+    def test_creates_dependency_successfully(self) -> None:
+        mock_client = Mock()
+        mock_client.requester.requestJson.return_value = (201, {}, {"id": 123})
+
+        result = create_issue_dependency(mock_client, "owner", "repo", blocked_issue_number=10, blocking_issue_id=999)
+
+        assert result is True
+        mock_client.requester.requestJson.assert_called_once_with(
+            "POST",
+            "/repos/owner/repo/issues/10/dependencies/blocked_by",
+            input={"issue_id": 999},
+        )
+
+    def test_returns_false_on_422(self) -> None:
+        mock_client = Mock()
+        mock_client.requester.requestJson.side_effect = _ALREADY_EXISTS
+
+        result = create_issue_dependency(mock_client, "owner", "repo", blocked_issue_number=10, blocking_issue_id=999)
+
+        assert result is False
+
+    @pytest.mark.parametrize("error", [_NOT_FOUND, _SERVER_ERROR], ids=["404", "500"])
+    def test_reraises_other_errors(self, error: GithubException) -> None:
+        mock_client = Mock()
+        mock_client.requester.requestJson.side_effect = error
+
+        with pytest.raises(GithubException) as exc_info:
+            create_issue_dependency(mock_client, "owner", "repo", blocked_issue_number=10, blocking_issue_id=999)
+
+        assert exc_info.value.status == error.status
+
+
+@pytest.fixture
+def mock_post(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the HTTP POST used for GitHub GraphQL requests."""
+    post = Mock()
+    monkeypatch.setattr("gitlab_to_github_migrator.github_utils.requests.post", post)
+    return post
+
+
+@pytest.mark.unit
+class TestDeleteIssue:
+    def test_deletes_issue_successfully(self, mock_post: Mock) -> None:
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {"data": {"deleteIssue": {"clientMutationId": None}}}
+        mock_post.return_value = mock_response
+
+        # Should not raise any exception
+        delete_issue("fake_token", "gid_123")
+
+        # Verify the request was made correctly
+        mock_post.assert_called_once()
+        assert mock_post.call_args.args[0] == "https://api.github.com/graphql"
+        assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Bearer fake_token"
+
+    @pytest.mark.parametrize(
+        ("status_code", "payload"),
+        [
+            (404, None),
+            (200, {"errors": [{"message": "Issue not found"}]}),
+            (200, {"data": {"unexpected": "response"}}),
+        ],
+        ids=["http-error", "graphql-error", "unexpected-response"],
+    )
+    def test_raises_migration_error(self, mock_post: Mock, status_code: int, payload: dict[str, Any] | None) -> None:
+        mock_response = Mock(status_code=status_code, text="Not found")
+        mock_response.json.return_value = payload
+        mock_post.return_value = mock_response
+
+        with pytest.raises(MigrationError):
+            delete_issue("fake_token", "gid_123")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
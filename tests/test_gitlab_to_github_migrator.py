@@ -2,168 +2,142 @@
 Tests for GitLab to GitHub Migration Tool
 """
 
-from unittest.mock import Mock, PropertyMock, patch
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, call
 
 import pytest
 from github import GithubException
+from github.Issue import Issue
 from gitlab.exceptions import GitlabError
 
 from gitlab_to_github_migrator import GitlabToGithubMigrator, MigrationError
-from gitlab_to_github_migrator.attachments import ProcessedContent
-from gitlab_to_github_migrator.gitlab_utils import get_work_item_children
+from gitlab_to_github_migrator.attachments import AttachmentHandler, ProcessedContent
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-@pytest.mark.unit
-class TestGitlabToGithubMigrator:
-    """Test main migration functionality."""
+# Stand-in for repository items that validation only counts (tags)
+_ITEM = object()
 
-    def setup_method(self) -> None:
-        """Setup test fixtures."""
-        self.gitlab_project_path: str = "test-org/test-project"
-        self.github_repo_path: str = "github-org/test-repo"
-
-        # Mock GitLab project
-        self.mock_gitlab_project: Mock = Mock()
-        self.mock_gitlab_project.id = 12345
-        self.mock_gitlab_project.name = "test-project"
-        self.mock_gitlab_project.description = "Test project description"
-        self.mock_gitlab_project.web_url = "https://gitlab.com/test-org/test-project"
-        self.mock_gitlab_project.ssh_url_to_repo = "git@gitlab.com:test-org/test-project.git"
-
-        # Mock GitHub repo
-        self.mock_github_repo: Mock = Mock()
-        self.mock_github_repo.html_url = "https://github.com/github-org/test-repo"
-        self.mock_github_repo.ssh_url = "git@github.com:github-org/test-repo.git"
-
-    def _create_mock_milestone(self, iid: int, state: str = "active", due_date: str | None = None) -> Mock:
-        """Create a mock GitLab milestone with standard attributes."""
-        from datetime import UTC, datetime, timedelta
-
-        base = datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
-        created = base + timedelta(hours=iid)
-        updated = created + timedelta(minutes=30)
-
-        mock = Mock()
-        mock.iid = iid
-        mock.id = 100 + iid
-        mock.title = f"Milestone {iid}"
-        mock.state = state
-        mock.description = f"Milestone {iid} description"
-        mock.due_date = due_date
-        mock.created_at = created.strftime("%Y-%m-%dT%H:%M:%SZ")
-        mock.updated_at = updated.strftime("%Y-%m-%dT%H:%M:%SZ")
-        return mock
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_init(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test migrator initialization."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
+# Migrated (non-placeholder) GitHub issue and milestone; validation only reads them
+_REAL_ISSUE = SimpleNamespace(title="Real Issue", state="open")
+_REAL_MILESTONE = SimpleNamespace(title="Real Milestone", state="open")
 
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
+# Author of every GitLab note in the comment migration tests; only read, so shared
+_NOTE_AUTHOR = {"name": "Test User", "username": "testuser"}
 
-        migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
-            label_translations=["p_*:priority: *"],
-            github_token="test_token",
-        )
 
-        assert migrator.gitlab_project_path == self.gitlab_project_path
-        assert migrator.github_repo_path == self.github_repo_path
-        assert migrator._label_translations == ["p_*:priority: *"]
+class _FailingProject:
+    """GitLab project whose API access fails once the migrator starts using it."""
 
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_validate_api_access_success(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test successful API validation."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
-        mock_github_client.get_user.return_value = Mock()
-
-        migrator = GitlabToGithubMigrator(self.gitlab_project_path, self.github_repo_path, github_token="test_token")
-
-        # Should not raise an exception
-        migrator.validate_api_access()
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_validate_api_access_gitlab_failure(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test GitLab API validation failure."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        # Make GitLab project accessible during init but fail during validation
-        mock_gitlab_project = Mock()
-        mock_gitlab_project.name = "test-project"  # Works during init
-        mock_gitlab_client.projects.get.return_value = mock_gitlab_project
-
-        migrator = GitlabToGithubMigrator(self.gitlab_project_path, self.github_repo_path, github_token="test_token")
-
-        # Now make the name property fail by replacing the project
-        failing_project = Mock()
-        type(failing_project).name = PropertyMock(side_effect=GitlabError("GitLab API error"))
-        migrator.gitlab_project = failing_project
-
-        with pytest.raises(MigrationError, match="GitLab API access failed"):
-            migrator.validate_api_access()
+    @property
+    def name(self) -> str:
+        msg = "GitLab API error"
+        raise GitlabError(msg)
 
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_handle_labels(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test label handling and translation."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
 
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
+def _branches(count: int) -> list[SimpleNamespace]:
+    """Branches as listed by GitLab or GitHub; commit counting only reads their name."""
+    return [SimpleNamespace(name=f"branch-{i}") for i in range(count)]
 
-        # Mock GitLab labels
-        mock_label1 = Mock()
-        mock_label1.name = "p_high"
-        mock_label1.color = "#ff0000"
-        mock_label1.description = "High priority"
 
-        mock_label2 = Mock()
-        mock_label2.name = "bug"
-        mock_label2.color = "#00ff00"
-        mock_label2.description = "Bug report"
+def _gitlab_commits(count: int) -> list[SimpleNamespace]:
+    """Distinct GitLab commits (identified by id)."""
+    return [SimpleNamespace(id=f"sha-{i}") for i in range(count)]
 
-        self.mock_gitlab_project.labels.list.return_value = [mock_label1, mock_label2]
 
-        # Mock GitHub organization (no default labels)
-        mock_org = Mock()
-        mock_org.get_labels.side_effect = GithubException(404, {}, headers={})
-        mock_github_client.get_organization.return_value = mock_org
+def _github_commits(count: int) -> list[SimpleNamespace]:
+    """Distinct GitHub commits (identified by sha)."""
+    return [SimpleNamespace(sha=f"sha-{i}") for i in range(count)]
 
-        # Mock GitHub repo labels
-        self.mock_github_repo.get_labels.return_value = []
 
-        def create_label_side_effect(**kwargs):
-            label = Mock()
-            label.name = kwargs["name"]
-            return label
+# Every test in this module is a unit test running against mocked GitLab and GitHub clients
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("mock_gitlab_client", "mock_github_client")]
 
-        self.mock_github_repo.create_label.side_effect = create_label_side_effect
 
+class TestGitlabToGithubMigrator:
+    """Test main migration functionality."""
+
+    def _create_mock_milestone(self, iid: int, state: str = "active", due_date: str | None = None) -> SimpleNamespace:
+        """Create a mock GitLab milestone with the attributes milestone migration reads."""
+        return SimpleNamespace(
+            iid=iid,
+            id=100 + iid,
+            title=f"Milestone {iid}",
+            state=state,
+            description=f"Milestone {iid} description",
+            due_date=due_date,
+        )
+
+    def test_init(self, mock_gitlab_project: Mock) -> None:
+        """Test migrator initialization."""
         migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
+            "test-org/test-project",
+            "github-org/test-repo",
             label_translations=["p_*:priority: *"],
             github_token="test_token",
         )
-        migrator.github_repo = self.mock_github_repo
 
+        assert migrator.gitlab_project_path == "test-org/test-project"
+        assert migrator.github_repo_path == "github-org/test-repo"
+        assert migrator.gitlab_project is mock_gitlab_project
+        assert migrator._label_translations == ["p_*:priority: *"]
+
+    @pytest.mark.parametrize(
+        ("failing_project", "github_error", "expected_error"),
+        [
+            (None, None, None),
+            (_FailingProject(), None, "GitLab API access failed"),
+            (
+                None,
+                GithubException(401, {"message": "Bad credentials"}, headers={}),
+                "GitHub API access failed",
+            ),
+        ],
+        ids=["success", "gitlab-failure", "github-failure"],
+    )
+    def test_validate_api_access(
+        self,
+        migrator: GitlabToGithubMigrator,
+        mock_github_client: Mock,
+        failing_project: _FailingProject | None,
+        github_error: GithubException | None,
+        expected_error: str | None,
+    ) -> None:
+        """Test API validation with working and failing GitLab/GitHub access."""
+        if failing_project is not None:
+            # Project was accessible during init; swap in one whose API access fails during validation
+            migrator.gitlab_project = failing_project
+        mock_github_client.get_user.side_effect = github_error
+
+        if expected_error is None:
+            migrator.validate_api_access()
+        else:
+            with pytest.raises(MigrationError, match=expected_error):
+                migrator.validate_api_access()
+
+    def test_handle_labels(
+        self,
+        make_migrator: Callable[..., GitlabToGithubMigrator],
+        mock_gitlab_project: Mock,
+        mock_github_repo: Mock,
+    ) -> None:
+        """Test label handling and translation."""
+        # Mock GitLab labels
+        mock_label1 = SimpleNamespace(name="p_high", color="#ff0000", description="High priority")
+        mock_label2 = SimpleNamespace(name="bug", color="#00ff00", description="Bug report")
+
+        mock_gitlab_project.labels.list.return_value = [mock_label1, mock_label2]
+
+        # Mock GitHub repo labels
+        mock_github_repo.get_labels.return_value = []
+
+        mock_github_repo.create_label.side_effect = SimpleNamespace
+
+        migrator = make_migrator(label_translations=["p_*:priority: *"])
         migrator.migrate_labels()
 
         # Check label mapping
@@ -172,43 +146,62 @@ class TestGitlabToGithubMigrator:
         assert migrator.label_mapping["p_high"] == "priority: high"
         assert migrator.label_mapping["bug"] == "bug"
 
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_migrate_milestones_with_gaps(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test milestone migration with gaps in numbering."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
+        # Both labels are created in the repository, the first under its translated name
+        assert mock_github_repo.create_label.call_args_list == [
+            call(name="priority: high", color="ff0000", description="High priority"),
+            call(name="bug", color="00ff00", description="Bug report"),
+        ]
+
+    def test_gitlab_collections_fetched_once(
+        self, migrator: GitlabToGithubMigrator, mock_gitlab_project: Mock, mock_github_repo: Mock
+    ) -> None:
+        """Test that labels, milestones and issues are listed once for migration and validation."""
+        mock_label = SimpleNamespace(name="bug", color="#00ff00", description="")
+        mock_gitlab_project.labels.list.return_value = [mock_label]
+        mock_gitlab_project.milestones.list.return_value = []
+        mock_gitlab_project.issues.list.return_value = []
+        mock_gitlab_project.branches.list.return_value = []
+        mock_gitlab_project.tags.list.return_value = []
+
+        mock_github_repo.get_labels.return_value = []
+        mock_github_repo.get_issues.return_value = []
+        mock_github_repo.get_milestones.return_value = []
+        mock_github_repo.get_branches.return_value = []
+        mock_github_repo.get_tags.return_value = []
 
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
+        migrator.migrate_labels()
+        migrator.migrate_milestones_with_number_preservation()
+        migrator.migrate_issues_with_number_preservation()
+        report = migrator.validate_migration()
 
+        assert report["statistics"]["gitlab_labels_total"] == 1
+        assert mock_gitlab_project.labels.list.call_count == 1
+        assert mock_gitlab_project.milestones.list.call_count == 1
+        assert mock_gitlab_project.issues.list.call_count == 1
+
+    def test_migrate_milestones_with_gaps(
+        self, migrator: GitlabToGithubMigrator, mock_gitlab_project: Mock, mock_github_repo: Mock
+    ) -> None:
+        """Test milestone migration with gaps in numbering."""
         # Mock GitLab milestones with gaps (1, 3, 5)
         mock_milestone1 = self._create_mock_milestone(1)
         mock_milestone3 = self._create_mock_milestone(3, state="closed", due_date="2024-03-01")
         mock_milestone5 = self._create_mock_milestone(5)
-        self.mock_gitlab_project.milestones.list.return_value = [mock_milestone1, mock_milestone3, mock_milestone5]
+        mock_gitlab_project.milestones.list.return_value = [mock_milestone1, mock_milestone3, mock_milestone5]
 
-        # Mock GitHub milestone creation
-        created_milestones = []
-
-        def create_milestone_side_effect(**kwargs):
-            milestone = Mock()
-            milestone.number = len(created_milestones) + 1
-            milestone.title = kwargs["title"]
-            milestone.state = kwargs["state"]
-            created_milestones.append(milestone)
-            return milestone
-
-        self.mock_github_repo.create_milestone.side_effect = create_milestone_side_effect
-
-        migrator = GitlabToGithubMigrator(self.gitlab_project_path, self.github_repo_path, github_token="test_token")
-        migrator.github_repo = self.mock_github_repo
+        # GitHub hands out milestone numbers sequentially
+        created_milestones = [SimpleNamespace(number=number, delete=Mock()) for number in range(1, 6)]
+        mock_github_repo.create_milestone.side_effect = created_milestones
 
         migrator.migrate_milestones_with_number_preservation()
 
         # Should create 5 milestones (3 real, 2 placeholders)
-        assert self.mock_github_repo.create_milestone.call_count == 5
+        assert mock_github_repo.create_milestone.call_count == 5
+        placeholder_calls = [mock_github_repo.create_milestone.call_args_list[i] for i in (1, 3)]
+        assert all(c.kwargs["title"] == "Placeholder Milestone" for c in placeholder_calls)
+
+        # Only the placeholders are deleted again
+        assert [m.number for m in created_milestones if m.delete.called] == [2, 4]
 
         # Check milestone mapping for real milestones
         assert 101 in migrator.milestone_mapping  # milestone1.id -> 1
@@ -219,152 +212,112 @@ class TestGitlabToGithubMigrator:
         assert migrator.milestone_mapping[103] == 3
         assert migrator.milestone_mapping[105] == 5
 
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_validation_report_success(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test successful validation report generation."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
-
-        migrator = GitlabToGithubMigrator(self.gitlab_project_path, self.github_repo_path, github_token="test_token")
-        migrator.gitlab_project = self.mock_gitlab_project
-        migrator.github_repo = self.mock_github_repo
-        migrator.label_mapping = {"label1": "label1", "label2": "label2"}
-
-        # Mock GitLab items
-        self.mock_gitlab_project.issues.list.return_value = [Mock(), Mock()]  # 2 issues
-        self.mock_gitlab_project.milestones.list.return_value = [Mock()]  # 1 milestone
-        self.mock_gitlab_project.labels.list.return_value = [Mock(), Mock()]  # 2 labels
-        self.mock_gitlab_project.branches.list.return_value = [Mock(), Mock()]  # 2 branches
-        self.mock_gitlab_project.tags.list.return_value = [Mock()]  # 1 tag
-        self.mock_gitlab_project.commits.list.return_value = [Mock() for _ in range(5)]  # 5 commits
-
-        # Mock GitHub items (no placeholders)
-        github_issues = [Mock(), Mock()]
-        for issue in github_issues:
-            issue.title = "Real Issue"
-        self.mock_github_repo.get_issues.return_value = github_issues
-
-        github_milestones = [Mock()]
-        for milestone in github_milestones:
-            milestone.title = "Real Milestone"
-        self.mock_github_repo.get_milestones.return_value = github_milestones
-
-        # Mock GitHub labels
-        self.mock_github_repo.get_labels.return_value = []
-
-        # Mock GitHub git repository items
-        self.mock_github_repo.get_branches.return_value = [Mock(), Mock()]  # 2 branches
-        self.mock_github_repo.get_tags.return_value = [Mock()]  # 1 tag
-        self.mock_github_repo.get_commits.return_value = [Mock() for _ in range(5)]  # 5 commits
-
-        report = migrator.validate_migration()
+    def test_migrate_milestones_invalid_due_date_creates_nothing(
+        self, migrator: GitlabToGithubMigrator, mock_gitlab_project: Mock, mock_github_repo: Mock
+    ) -> None:
+        """Test that a malformed milestone fails before any GitHub milestone is created."""
+        mock_gitlab_project.milestones.list.return_value = [
+            self._create_mock_milestone(1),
+            self._create_mock_milestone(3, due_date="not-a-date"),
+        ]
 
-        assert report["success"] is True
-        assert len(report["errors"]) == 0
-        assert report["statistics"]["gitlab_issues_total"] == 2
-        assert report["statistics"]["github_issues_total"] == 2
-        assert report["statistics"]["gitlab_milestones_total"] == 1
-        assert report["statistics"]["github_milestones_total"] == 1
-        assert report["statistics"]["labels_translated"] == 2
-        assert report["statistics"]["gitlab_branches"] == 2
-        assert report["statistics"]["gitlab_tags"] == 1
-        assert report["statistics"]["gitlab_commits"] == 5
-        assert report["statistics"]["github_branches"] == 2
-        assert report["statistics"]["github_tags"] == 1
-        assert report["statistics"]["github_commits"] == 5
-        assert report["statistics"]["comments_migrated"] == 0
-        assert report["statistics"]["attachments_uploaded"] == 0
-        assert report["statistics"]["attachments_referenced"] == 0
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_validation_report_failure(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test validation report with mismatched counts."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
-
-        migrator = GitlabToGithubMigrator(self.gitlab_project_path, self.github_repo_path, github_token="test_token")
-        migrator.gitlab_project = self.mock_gitlab_project
-        migrator.github_repo = self.mock_github_repo
-        migrator.label_mapping = {}
+        with pytest.raises(ValueError, match="not-a-date"):
+            migrator.migrate_milestones_with_number_preservation()
+
+        mock_github_repo.create_milestone.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("github_counts", "expected_errors"),
+        [
+            ({"issues": 2, "milestones": 1, "branches": 2, "tags": 1, "commits": 5}, []),
+            (
+                {"issues": 1, "milestones": 2, "branches": 1, "tags": 2, "commits": 3},
+                [
+                    "Issue count mismatch",
+                    "Milestone count mismatch",
+                    "Branch count mismatch",
+                    "Tag count mismatch",
+                    "Commit count mismatch",
+                ],
+            ),
+        ],
+        ids=["matching-counts", "mismatched-counts"],
+    )
+    def test_validation_report(
+        self,
+        migrator: GitlabToGithubMigrator,
+        mock_gitlab_project: Mock,
+        mock_github_repo: Mock,
+        github_counts: dict[str, int],
+        expected_errors: list[str],
+    ) -> None:
+        """Test validation report generation against matching and mismatched GitHub counts."""
+        migrator.label_mapping = {"label1": "label1", "label2": "label2"}
 
-        # Mock mismatched counts
-        self.mock_gitlab_project.issues.list.return_value = [Mock(), Mock()]  # 2 issues
-        self.mock_gitlab_project.milestones.list.return_value = [Mock()]  # 1 milestone
-        self.mock_gitlab_project.labels.list.return_value = []  # No labels
-        self.mock_gitlab_project.branches.list.return_value = [Mock(), Mock()]  # 2 branches
-        self.mock_gitlab_project.tags.list.return_value = [Mock()]  # 1 tag
-        self.mock_gitlab_project.commits.list.return_value = [Mock() for _ in range(5)]  # 5 commits
-
-        # Mock GitHub with different counts
-        github_issues = [Mock()]  # Only 1 issue
-        for issue in github_issues:
-            issue.title = "Real Issue"
-        self.mock_github_repo.get_issues.return_value = github_issues
-
-        github_milestones = [Mock(), Mock()]  # 2 milestones
-        for milestone in github_milestones:
-            milestone.title = "Real Milestone"
-        self.mock_github_repo.get_milestones.return_value = github_milestones
-
-        # Mock GitHub labels
-        self.mock_github_repo.get_labels.return_value = []
-
-        # Mock GitHub git repository items with mismatched counts
-        self.mock_github_repo.get_branches.return_value = [Mock()]  # Only 1 branch (mismatch)
-        self.mock_github_repo.get_tags.return_value = [Mock(), Mock()]  # 2 tags (mismatch)
-        self.mock_github_repo.get_commits.return_value = [Mock() for _ in range(3)]  # 3 commits (mismatch)
+        # GitLab: 2 issues, 1 milestone, 2 labels, 2 branches, 1 tag, 5 commits
+        mock_gitlab_project.issues.list.return_value = [
+            SimpleNamespace(state="opened"),
+            SimpleNamespace(state="closed"),
+        ]
+        mock_gitlab_project.milestones.list.return_value = [SimpleNamespace(state="active")]
+        mock_gitlab_project.labels.list.return_value = [SimpleNamespace(name="label1"), SimpleNamespace(name="label2")]
+        mock_gitlab_project.branches.list.return_value = _branches(2)
+        mock_gitlab_project.tags.list.return_value = [_ITEM]
+        mock_gitlab_project.commits.list.return_value = _gitlab_commits(5)
+
+        # GitHub (no placeholders)
+        mock_github_repo.get_issues.return_value = [_REAL_ISSUE] * github_counts["issues"]
+        mock_github_repo.get_milestones.return_value = [_REAL_MILESTONE] * github_counts["milestones"]
+        mock_github_repo.get_labels.return_value = []
+        mock_github_repo.get_branches.return_value = _branches(github_counts["branches"])
+        mock_github_repo.get_tags.return_value = [_ITEM] * github_counts["tags"]
+        mock_github_repo.get_commits.return_value = _github_commits(github_counts["commits"])
 
         report = migrator.validate_migration()
 
-        assert report["success"] is False
-        assert len(report["errors"]) == 5  # Issue, milestone, branch, tag, and commit count mismatches
-        assert "Issue count mismatch" in report["errors"][0]
-        assert "Milestone count mismatch" in report["errors"][1]
-        assert "Branch count mismatch" in report["errors"][2]
-        assert "Tag count mismatch" in report["errors"][3]
-        assert "Commit count mismatch" in report["errors"][4]
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_comments_and_attachments_tracking(self, mock_github_class, mock_gitlab_class) -> None:
+        assert report["success"] is (not expected_errors)
+        assert len(report["errors"]) == len(expected_errors)
+        for error, expected in zip(report["errors"], expected_errors, strict=True):
+            assert expected in error
+
+        statistics = report["statistics"]
+        assert statistics["gitlab_issues_total"] == 2
+        assert statistics["gitlab_issues_open"] == 1
+        assert statistics["gitlab_milestones_total"] == 1
+        assert statistics["labels_translated"] == 2
+        assert statistics["gitlab_branches"] == 2
+        assert statistics["gitlab_tags"] == 1
+        assert statistics["gitlab_commits"] == 5
+        assert statistics["github_issues_total"] == github_counts["issues"]
+        assert statistics["github_milestones_total"] == github_counts["milestones"]
+        assert statistics["github_branches"] == github_counts["branches"]
+        assert statistics["github_tags"] == github_counts["tags"]
+        assert statistics["github_commits"] == github_counts["commits"]
+        assert statistics["comments_migrated"] == 0
+        assert statistics["attachments_uploaded"] == 0
+        assert statistics["attachments_referenced"] == 0
+
+    def test_comments_and_attachments_tracking(
+        self, migrator: GitlabToGithubMigrator, mock_gitlab_project: Mock, mock_github_repo: Mock
+    ) -> None:
         """Test that comments and attachments are tracked correctly."""
-        from gitlab_to_github_migrator.attachments import AttachmentHandler
-
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
-
-        migrator = GitlabToGithubMigrator(self.gitlab_project_path, self.github_repo_path, github_token="test_token")
-        migrator.gitlab_project = self.mock_gitlab_project
-        migrator.github_repo = self.mock_github_repo
         migrator.label_mapping = {}
 
         # Mock GitLab items
-        self.mock_gitlab_project.issues.list.return_value = [Mock()]  # 1 issue
-        self.mock_gitlab_project.milestones.list.return_value = []
-        self.mock_gitlab_project.labels.list.return_value = []
-        self.mock_gitlab_project.branches.list.return_value = [Mock()]  # 1 branch
-        self.mock_gitlab_project.tags.list.return_value = []
-        self.mock_gitlab_project.commits.list.return_value = [Mock()]  # 1 commit
+        mock_gitlab_project.issues.list.return_value = [SimpleNamespace(state="opened")]  # 1 issue
+        mock_gitlab_project.milestones.list.return_value = []
+        mock_gitlab_project.labels.list.return_value = []
+        mock_gitlab_project.branches.list.return_value = _branches(1)
+        mock_gitlab_project.tags.list.return_value = []
+        mock_gitlab_project.commits.list.return_value = _gitlab_commits(1)
 
         # Mock GitHub items
-        github_issues = [Mock()]
-        self.mock_github_repo.get_issues.return_value = github_issues
-        self.mock_github_repo.get_milestones.return_value = []
-        self.mock_github_repo.get_labels.return_value = []
-        self.mock_github_repo.get_branches.return_value = [Mock()]  # 1 branch
-        self.mock_github_repo.get_tags.return_value = []
-        self.mock_github_repo.get_commits.return_value = [Mock()]  # 1 commit
+        mock_github_repo.get_issues.return_value = [_REAL_ISSUE]
+        mock_github_repo.get_milestones.return_value = []
+        mock_github_repo.get_labels.return_value = []
+        mock_github_repo.get_branches.return_value = _branches(1)
+        mock_github_repo.get_tags.return_value = []
+        mock_github_repo.get_commits.return_value = _github_commits(1)
 
         # Set up comment and attachment tracking
         migrator.total_comments_migrated = 5
@@ -380,456 +333,135 @@ class TestGitlabToGithubMigrator:
         assert report["statistics"]["attachments_uploaded"] == 3
         assert report["statistics"]["attachments_referenced"] == 7
 
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_mark_gitlab_project_as_migrated(self, mock_github_class, mock_gitlab_class) -> None:
+    def test_mark_gitlab_project_as_migrated(
+        self, migrator: GitlabToGithubMigrator, mock_gitlab_project: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that mark_gitlab_project_as_migrated delegates to gitlab_utils."""
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_client.projects.get.return_value = self.mock_gitlab_project
-        self.mock_gitlab_project.name = "My Project"
-        self.mock_gitlab_project.description = "Original description"
-        self.mock_github_repo.html_url = "https://github.com/github-org/test-repo"
-
-        migrator = GitlabToGithubMigrator(self.gitlab_project_path, self.github_repo_path, github_token="test_token")
-        migrator.github_repo = self.mock_github_repo
-
-        with patch("gitlab_to_github_migrator.migrator.glu.mark_project_as_migrated") as mock_mark:
-            migrator.mark_gitlab_project_as_migrated()
-            mock_mark.assert_called_once_with(self.mock_gitlab_project, "https://github.com/github-org/test-repo")
+        mock_gitlab_project.name = "My Project"
+        mock_gitlab_project.description = "Original description"
 
+        mock_mark = Mock()
+        monkeypatch.setattr("gitlab_to_github_migrator.migrator.glu.mark_project_as_migrated", mock_mark)
 
-@pytest.mark.unit
-class TestCreateIssueDependency:
-    def test_creates_dependency_successfully(self) -> None:
-        from unittest.mock import Mock
+        migrator.mark_gitlab_project_as_migrated()
 
-        from gitlab_to_github_migrator.github_utils import create_issue_dependency
+        mock_mark.assert_called_once_with(mock_gitlab_project, "https://github.com/github-org/test-repo")
 
-        mock_client = Mock()
-        mock_client.requester.requestJson.return_value = (201, {}, {"id": 123})
 
-        result = create_issue_dependency(mock_client, "owner", "repo", blocked_issue_number=10, blocking_issue_id=999)
+@pytest.fixture
+def mock_gitlab_issue() -> Mock:
+    """GitLab issue without description; tests set the notes it lists."""
+    return Mock(iid=1, description=None)
 
-        assert result is True
-        mock_client.requester.requestJson.assert_called_once_with(
-            "POST",
-            "/repos/owner/repo/issues/10/dependencies/blocked_by",
-            input={"issue_id": 999},
-        )
 
-    def test_returns_false_on_422(self) -> None:
-        from unittest.mock import Mock
+@pytest.fixture
+def mock_github_issue() -> Mock:
+    """GitHub issue receiving the migrated comments."""
+    return Mock(spec=Issue)
 
-        from gitlab_to_github_migrator.github_utils import create_issue_dependency
 
-        mock_client = Mock()
-        mock_client.requester.requestJson.side_effect = GithubException(422, {"message": "Already exists"}, headers={})
+@pytest.fixture
+def mock_attachment_handler(migrator: GitlabToGithubMigrator) -> Mock:
+    """Attachment handler installed on the migrator; leaves comment bodies unchanged by default."""
+    handler = Mock()
+    handler.process_content.side_effect = lambda content, **_: ProcessedContent(content=content, attachment_count=0)
+    migrator._attachment_handler = handler
+    return handler
 
-        result = create_issue_dependency(mock_client, "owner", "repo", blocked_issue_number=10, blocking_issue_id=999)
 
-        assert result is False
-
-
-@pytest.mark.unit
-class TestDeleteIssue:
-    def test_deletes_issue_successfully(self) -> None:
-        from unittest.mock import Mock, patch
-
-        from gitlab_to_github_migrator.github_utils import delete_issue
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"deleteIssue": {"clientMutationId": None}}}
-
-        with patch("gitlab_to_github_migrator.github_utils.requests.post", return_value=mock_response) as mock_post:
-            # Should not raise any exception
-            delete_issue("fake_token", "gid_123")
-
-            # Verify the request was made correctly
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            assert call_args[0][0] == "https://api.github.com/graphql"
-            assert call_args[1]["headers"]["Authorization"] == "Bearer fake_token"
-
-    def test_raises_exception_on_http_error(self) -> None:
-        from unittest.mock import Mock, patch
-
-        from gitlab_to_github_migrator.exceptions import MigrationError
-        from gitlab_to_github_migrator.github_utils import delete_issue
-
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Not found"
-
-        with (
-            patch("gitlab_to_github_migrator.github_utils.requests.post", return_value=mock_response),
-            pytest.raises(MigrationError),
-        ):
-            delete_issue("fake_token", "gid_123")
-
-    def test_raises_exception_on_graphql_error(self) -> None:
-        from unittest.mock import Mock, patch
-
-        from gitlab_to_github_migrator.exceptions import MigrationError
-        from gitlab_to_github_migrator.github_utils import delete_issue
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"errors": [{"message": "Issue not found"}]}
-
-        with (
-            patch("gitlab_to_github_migrator.github_utils.requests.post", return_value=mock_response),
-            pytest.raises(MigrationError),
-        ):
-            delete_issue("fake_token", "gid_123")
-
-    def test_raises_error_on_unexpected_response(self) -> None:
-        from unittest.mock import Mock, patch
-
-        from gitlab_to_github_migrator.exceptions import MigrationError
-        from gitlab_to_github_migrator.github_utils import delete_issue
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"unexpected": "response"}}
-
-        with (
-            patch("gitlab_to_github_migrator.github_utils.requests.post", return_value=mock_response),
-            pytest.raises(MigrationError),
-        ):
-            delete_issue("fake_token", "gid_123")
-
-
-@pytest.mark.unit
-class TestGetWorkItemChildren:
-    def test_returns_empty_list_when_no_children(self) -> None:
-        mock_graphql = Mock()
-        mock_graphql.execute.return_value = {
-            "namespace": {
-                "workItem": {
-                    "iid": "42",
-                    "widgets": [{"type": "HIERARCHY", "children": {"nodes": []}}],
-                }
-            }
-        }
-
-        result = get_work_item_children(mock_graphql, "org/project", 42)
-        assert result == []
-
-    def test_returns_children_when_present(self) -> None:
-        mock_graphql = Mock()
-        mock_graphql.execute.return_value = {
-            "namespace": {
-                "workItem": {
-                    "iid": "42",
-                    "widgets": [
-                        {
-                            "type": "HIERARCHY",
-                            "children": {
-                                "nodes": [
-                                    {
-                                        "iid": "100",
-                                        "title": "Child task",
-                                        "state": "opened",
-                                        "workItemType": {"name": "Task"},
-                                        "webUrl": "https://gitlab.com/org/proj/-/issues/100",
-                                    }
-                                ]
-                            },
-                        }
-                    ],
-                }
-            }
-        }
-
-        result = get_work_item_children(mock_graphql, "org/project", 42)
-        assert len(result) == 1
-        assert result[0] == 100
-
-
-@pytest.mark.unit
 class TestCommentMigration:
     """Test comment migration functionality."""
 
-    def setup_method(self) -> None:
-        """Setup test fixtures."""
-        self.gitlab_project_path: str = "test-org/test-project"
-        self.github_repo_path: str = "github-org/test-repo"
-
-    def _create_mock_note(
-        self, created_at: str, body: str | None, *, system: bool = False, author: dict[str, str] | None = None
-    ) -> Mock:
-        """Create a mock GitLab note."""
-        note = Mock()
-        note.created_at = created_at
-        note.updated_at = created_at  # Default to same as created_at
-        note.body = body
-        note.system = system
-        note.id = 1
-        if author is None:
-            author = {"name": "Test User", "username": "testuser"}
-        note.author = author
-        return note
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_single_system_note_compact_format(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test that a single system note uses compact format."""
-        # Setup mocks
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_project = Mock()
-        mock_gitlab_project.id = 12345
-        mock_gitlab_project.name = "test-project"
-        mock_gitlab_client.projects.get.return_value = mock_gitlab_project
-
-        # Create migrator
-        migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
-            github_token="test_token",
+    def _create_mock_note(self, created_at: str, body: str | None, *, system: bool = False) -> SimpleNamespace:
+        """Create a mock GitLab note written by the shared test author."""
+        # updated_at defaults to the same as created_at
+        return SimpleNamespace(
+            id=1, created_at=created_at, updated_at=created_at, body=body, system=system, author=_NOTE_AUTHOR
         )
 
-        # Mock issue
-        mock_gitlab_issue = Mock()
-        mock_github_issue = Mock()
-
-        # Single system note
-        system_note = self._create_mock_note("2026-01-27T20:18:55Z", "marked this issue as related to #1", system=True)
-        mock_gitlab_issue.notes.list.return_value = [system_note]
-
-        # Execute
-        migrator.migrate_issue_comments(mock_gitlab_issue, mock_github_issue)
-
-        # Verify - single system note should use compact format
-        mock_github_issue.create_comment.assert_called_once()
-        comment_body = mock_github_issue.create_comment.call_args[0][0]
-        assert comment_body.startswith("**System note**")
-        assert "2026-01-27 20:18:55Z by testuser" in comment_body
-        assert "marked this issue as related to #1" in comment_body
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_consecutive_system_notes_grouped_format(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test that consecutive system notes are grouped with markdown header."""
-        # Setup mocks
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_project = Mock()
-        mock_gitlab_project.id = 12345
-        mock_gitlab_project.name = "test-project"
-        mock_gitlab_client.projects.get.return_value = mock_gitlab_project
-
-        # Create migrator
-        migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
-            github_token="test_token",
-        )
-
-        # Mock issue
-        mock_gitlab_issue = Mock()
-        mock_github_issue = Mock()
-        mock_gitlab_issue.iid = 1
-
-        # Three consecutive system notes
-        system_notes = [
-            self._create_mock_note("2026-01-27T20:18:55Z", "marked this issue as related to #1", system=True),
-            self._create_mock_note(
-                "2026-01-27T20:19:10Z", "This is a long system note\n- that spans\n- multiple lines", system=True
+    @pytest.mark.parametrize(
+        ("notes", "expected_comments"),
+        [
+            pytest.param(
+                [("2026-01-27T20:18:55Z", "marked this issue as related to #1", True)],
+                [("**System note**", ["2026-01-27 20:18:55Z by testuser", "marked this issue as related to #1"])],
+                id="single-system-note-compact",
             ),
-            self._create_mock_note("2026-01-27T20:19:22Z", "marked this issue as closed", system=True),
-        ]
-        mock_gitlab_issue.notes.list.return_value = system_notes
-
-        # Execute
-        migrator.migrate_issue_comments(mock_gitlab_issue, mock_github_issue)
-
-        # Verify - single comment with grouped format
-        mock_github_issue.create_comment.assert_called_once()
-        comment_body = mock_github_issue.create_comment.call_args[0][0]
-
-        # Should have markdown header
-        assert comment_body.startswith("### System notes\n")
-
-        # Should have all three notes with timestamps and authors
-        assert "2026-01-27 20:18:55Z by testuser: marked this issue as related to #1" in comment_body
-        assert (
-            "2026-01-27 20:19:10Z by testuser: This is a long system note\n- that spans\n- multiple lines"
-            in comment_body
-        )
-        assert "2026-01-27 20:19:22Z by testuser: marked this issue as closed" in comment_body
-
-        # Should have empty lines between notes (double newlines)
-        assert "\n\n" in comment_body
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_non_consecutive_system_notes_separate_comments(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test that non-consecutive system notes create separate comments."""
-        # Setup mocks
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_project = Mock()
-        mock_gitlab_project.id = 12345
-        mock_gitlab_project.name = "test-project"
-        mock_gitlab_client.projects.get.return_value = mock_gitlab_project
-
-        # Create migrator
-        migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
-            github_token="test_token",
-        )
-
-        # Mock attachment handler
-        mock_attachment_handler = Mock()
-        mock_attachment_handler.process_content.return_value = ProcessedContent(
-            content="This is a user comment", attachment_count=0
-        )
-        migrator._attachment_handler = mock_attachment_handler
-
-        # Mock issue
-        mock_gitlab_issue = Mock()
-        mock_github_issue = Mock()
-        mock_gitlab_issue.iid = 1
-
-        # System note, user comment, system note
-        notes = [
-            self._create_mock_note("2026-01-27T20:18:55Z", "marked this issue as related to #1", system=True),
-            self._create_mock_note("2026-01-27T20:19:00Z", "This is a user comment", system=False),
-            self._create_mock_note("2026-01-27T20:19:22Z", "marked this issue as closed", system=True),
+            pytest.param(
+                [
+                    ("2026-01-27T20:18:55Z", "marked this issue as related to #1", True),
+                    ("2026-01-27T20:19:10Z", "This is a long system note\n- that spans\n- multiple lines", True),
+                    ("2026-01-27T20:19:22Z", "marked this issue as closed", True),
+                ],
+                [
+                    (
+                        "### System notes\n",
+                        [
+                            "2026-01-27 20:18:55Z by testuser: marked this issue as related to #1\n\n",
+                            "2026-01-27 20:19:10Z by testuser: This is a long system note\n- that spans\n- multiple lines",
+                            "2026-01-27 20:19:22Z by testuser: marked this issue as closed",
+                        ],
+                    )
+                ],
+                id="consecutive-system-notes-grouped",
+            ),
+            pytest.param(
+                [
+                    ("2026-01-27T20:18:55Z", "marked this issue as related to #1", True),
+                    ("2026-01-27T20:19:00Z", "This is a user comment", False),
+                    ("2026-01-27T20:19:22Z", "marked this issue as closed", True),
+                ],
+                [
+                    ("**System note**", ["marked this issue as related to #1"]),
+                    ("**Comment by**", ["This is a user comment"]),
+                    ("**System note**", ["marked this issue as closed"]),
+                ],
+                id="non-consecutive-system-notes-separate",
+            ),
+            pytest.param(
+                [
+                    ("2026-01-27T20:18:55Z", "marked this issue as related to #1", True),
+                    ("2026-01-27T20:19:10Z", "added label priority:high", True),
+                    ("2026-01-27T20:19:15Z", "Great work!", False),
+                    ("2026-01-27T20:19:20Z", "removed label priority:high", True),
+                    ("2026-01-27T20:19:22Z", "marked this issue as closed", True),
+                ],
+                [
+                    ("### System notes\n", ["marked this issue as related to #1", "added label priority:high"]),
+                    ("**Comment by**", ["Great work!"]),
+                    ("### System notes\n", ["removed label priority:high", "marked this issue as closed"]),
+                ],
+                id="mixed-consecutive-and-non-consecutive",
+            ),
+        ],
+    )
+    @pytest.mark.usefixtures("mock_attachment_handler")
+    def test_system_note_grouping(
+        self,
+        migrator: GitlabToGithubMigrator,
+        mock_gitlab_issue: Mock,
+        mock_github_issue: Mock,
+        notes: list[tuple[str, str, bool]],
+        expected_comments: list[tuple[str, list[str]]],
+    ) -> None:
+        """Test that consecutive system notes share one comment and user comments start a new one."""
+        mock_gitlab_issue.notes.list.return_value = [
+            self._create_mock_note(created_at, body, system=system) for created_at, body, system in notes
         ]
-        mock_gitlab_issue.notes.list.return_value = notes
 
-        # Execute
         migrator.migrate_issue_comments(mock_gitlab_issue, mock_github_issue)
 
-        # Verify - should create 3 separate comments
-        assert mock_github_issue.create_comment.call_count == 3
-
-        # First comment: single system note (compact format)
-        first_comment = mock_github_issue.create_comment.call_args_list[0][0][0]
-        assert first_comment.startswith("**System note**")
-        assert "marked this issue as related to #1" in first_comment
-
-        # Second comment: user comment
-        second_comment = mock_github_issue.create_comment.call_args_list[1][0][0]
-        assert "**Comment by**" in second_comment
-        assert "This is a user comment" in second_comment
-
-        # Third comment: single system note (compact format)
-        third_comment = mock_github_issue.create_comment.call_args_list[2][0][0]
-        assert third_comment.startswith("**System note**")
-        assert "marked this issue as closed" in third_comment
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_mixed_consecutive_and_non_consecutive_system_notes(self, mock_github_class, mock_gitlab_class) -> None:
-        """Test mixed scenario: consecutive system notes, user comment, more consecutive system notes."""
-        # Setup mocks
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_project = Mock()
-        mock_gitlab_project.id = 12345
-        mock_gitlab_project.name = "test-project"
-        mock_gitlab_client.projects.get.return_value = mock_gitlab_project
-
-        # Create migrator
-        migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
-            github_token="test_token",
-        )
-
-        # Mock attachment handler
-        mock_attachment_handler = Mock()
-        mock_attachment_handler.process_content.return_value = ProcessedContent(
-            content="Great work!", attachment_count=0
-        )
-        migrator._attachment_handler = mock_attachment_handler
-
-        # Mock issue
-        mock_gitlab_issue = Mock()
-        mock_github_issue = Mock()
-        mock_gitlab_issue.iid = 1
-
-        # Two system notes, user comment, two more system notes
-        notes = [
-            self._create_mock_note("2026-01-27T20:18:55Z", "marked this issue as related to #1", system=True),
-            self._create_mock_note("2026-01-27T20:19:10Z", "added label priority:high", system=True),
-            self._create_mock_note("2026-01-27T20:19:15Z", "Great work!", system=False),
-            self._create_mock_note("2026-01-27T20:19:20Z", "removed label priority:high", system=True),
-            self._create_mock_note("2026-01-27T20:19:22Z", "marked this issue as closed", system=True),
-        ]
-        mock_gitlab_issue.notes.list.return_value = notes
-
-        # Execute
-        migrator.migrate_issue_comments(mock_gitlab_issue, mock_github_issue)
+        comments = [c.args[0] for c in mock_github_issue.create_comment.call_args_list]
+        assert len(comments) == len(expected_comments)
+        for comment, (prefix, fragments) in zip(comments, expected_comments, strict=True):
+            assert comment.startswith(prefix)
+            for fragment in fragments:
+                assert fragment in comment
 
-        # Verify - should create 3 comments
-        assert mock_github_issue.create_comment.call_count == 3
-
-        # First comment: grouped system notes (2 consecutive)
-        first_comment = mock_github_issue.create_comment.call_args_list[0][0][0]
-        assert first_comment.startswith("### System notes\n")
-        assert "marked this issue as related to #1" in first_comment
-        assert "added label priority:high" in first_comment
-
-        # Second comment: user comment
-        second_comment = mock_github_issue.create_comment.call_args_list[1][0][0]
-        assert "**Comment by**" in second_comment
-        assert "Great work!" in second_comment
-
-        # Third comment: grouped system notes (2 consecutive)
-        third_comment = mock_github_issue.create_comment.call_args_list[2][0][0]
-        assert third_comment.startswith("### System notes\n")
-        assert "removed label priority:high" in third_comment
-        assert "marked this issue as closed" in third_comment
-
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_empty_system_note_body(self, mock_github_class, mock_gitlab_class) -> None:
+    def test_empty_system_note_body(
+        self, migrator: GitlabToGithubMigrator, mock_gitlab_issue: Mock, mock_github_issue: Mock
+    ) -> None:
         """Test that empty system note bodies are handled with '(empty note)' placeholder."""
-        # Setup mocks
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_project = Mock()
-        mock_gitlab_project.id = 12345
-        mock_gitlab_project.name = "test-project"
-        mock_gitlab_client.projects.get.return_value = mock_gitlab_project
-
-        # Create migrator
-        migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
-            github_token="test_token",
-        )
-
-        # Mock issue
-        mock_gitlab_issue = Mock()
-        mock_github_issue = Mock()
-        mock_gitlab_issue.iid = 1
-
         # System notes with empty bodies
         notes = [
             self._create_mock_note("2026-01-27T20:18:55Z", "", system=True),  # Empty string
@@ -853,37 +485,14 @@ class TestCommentMigration:
         assert "2026-01-27 20:19:10Z by testuser: (empty note)" in comment_body
         assert "2026-01-27 20:19:22Z by testuser: marked this issue as closed" in comment_body
 
-    @patch("gitlab_to_github_migrator.gitlab_utils.Gitlab")
-    @patch("gitlab_to_github_migrator.github_utils.Github")
-    def test_attachment_counting_in_comments(self, mock_github_class: Mock, mock_gitlab_class: Mock) -> None:
+    def test_attachment_counting_in_comments(
+        self,
+        migrator: GitlabToGithubMigrator,
+        mock_gitlab_issue: Mock,
+        mock_github_issue: Mock,
+        mock_attachment_handler: Mock,
+    ) -> None:
         """Test that attachments in comments are counted correctly."""
-        # Setup mocks
-        mock_gitlab_client = Mock()
-        mock_github_client = Mock()
-        mock_gitlab_class.return_value = mock_gitlab_client
-        mock_github_class.return_value = mock_github_client
-
-        mock_gitlab_project = Mock()
-        mock_gitlab_project.id = 12345
-        mock_gitlab_project.name = "test-project"
-        mock_gitlab_client.projects.get.return_value = mock_gitlab_project
-
-        # Create migrator
-        migrator = GitlabToGithubMigrator(
-            self.gitlab_project_path,
-            self.github_repo_path,
-            github_token="test_token",
-        )
-
-        mock_github_issue = Mock()
-
-        # Mock GitLab issue with no description
-        mock_gitlab_issue = Mock()
-        mock_gitlab_issue.iid = 1
-        mock_gitlab_issue.description = None
-
-        # Mock attachment handler to return different content for each call
-        mock_attachment_handler = Mock()
         # First call: 2 attachments, second call: 0 attachments
         mock_attachment_handler.process_content.side_effect = [
             ProcessedContent(
@@ -893,7 +502,6 @@ class TestCommentMigration:
             ),
             ProcessedContent(content="Plain comment without attachments", attachment_count=0),
         ]
-        migrator._attachment_handler = mock_attachment_handler
 
         # Mock notes - first with attachments, second without
         note_with_attachments = self._create_mock_note(
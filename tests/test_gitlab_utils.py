@@ -1,5 +1,7 @@
 """Tests for issue relationship data structures."""
 
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -7,9 +9,15 @@ import pytest
 from gitlab_to_github_migrator.gitlab_utils import (
     IssueCrossLinks,
     get_normal_issue_cross_links,
+    get_work_item_children,
     mark_project_as_migrated,
 )
 
+# Values mark_project_as_migrated writes for the GitHub repository used in these tests
+_GITHUB_URL = "https://github.com/org/repo"
+_MIGRATED_NAME = "My Project -- migrated to GitHub"
+_MIGRATED_HEADER = f"Migrated to {_GITHUB_URL}"
+
 
 @pytest.mark.unit
 class TestIssueCrossLinks:
@@ -25,67 +33,93 @@ class TestIssueCrossLinks:
 @pytest.mark.unit
 class TestMarkProjectAsMigrated:
     def _make_project(self, name: str, description: str | None) -> Mock:
-        project = Mock()
-        project.name = name
-        project.description = description
-        project.path_with_namespace = "org/project"
+        # Mock(name=...) would name the mock itself, so the project name goes through configure_mock
+        project = Mock(description=description, path_with_namespace="org/project")
+        project.configure_mock(name=name)
         return project
 
-    def test_appends_suffix_and_prepends_url(self) -> None:
-        project = self._make_project("My Project", "Original description")
-        mark_project_as_migrated(project, "https://github.com/org/repo")
-        assert project.name == "My Project -- migrated to GitHub"
-        assert project.description == "Migrated to https://github.com/org/repo\n\nOriginal description"
-        project.save.assert_called_once()
-
-    def test_none_description_becomes_url_only(self) -> None:
-        project = self._make_project("My Project", None)
-        mark_project_as_migrated(project, "https://github.com/org/repo")
-        assert project.name == "My Project -- migrated to GitHub"
-        assert project.description == "Migrated to https://github.com/org/repo"
+    @pytest.mark.parametrize(
+        ("name", "description", "expected_description"),
+        [
+            ("My Project", "Original description", f"{_MIGRATED_HEADER}\n\nOriginal description"),
+            ("My Project", None, _MIGRATED_HEADER),
+            (_MIGRATED_NAME, f"{_MIGRATED_HEADER}\n\nSome description", f"{_MIGRATED_HEADER}\n\nSome description"),
+        ],
+        ids=["appends-suffix-and-prepends-url", "none-description-becomes-url-only", "idempotent"],
+    )
+    def test_mark_project_as_migrated(self, name: str, description: str | None, expected_description: str) -> None:
+        project = self._make_project(name, description)
+        mark_project_as_migrated(project, _GITHUB_URL)
+        assert project.name == _MIGRATED_NAME
+        assert project.description == expected_description
         project.save.assert_called_once()
 
-    def test_idempotent_name(self) -> None:
-        project = self._make_project(
-            "My Project -- migrated to GitHub",
-            "Migrated to https://github.com/org/repo\n\nSome description",
-        )
-        mark_project_as_migrated(project, "https://github.com/org/repo")
-        assert project.name == "My Project -- migrated to GitHub"
-        assert project.description == "Migrated to https://github.com/org/repo\n\nSome description"
-
 
 @pytest.mark.unit
 class TestGetIssueCrossLinks:
-    def test_returns_empty_when_no_links(self) -> None:
-        mock_issue = Mock()
-        mock_issue.iid = 42
-        mock_issue.links.list.return_value = []
-
-        mock_graphql = Mock()
-        mock_graphql.execute.return_value = {"namespace": {"workItem": {"widgets": []}}}
+    @pytest.mark.parametrize(
+        ("links", "expected_blocked_iids"),
+        [
+            ([], []),
+            (
+                [
+                    SimpleNamespace(
+                        link_type="blocks",
+                        iid=100,
+                        title="Blocked issue",
+                        references={"full": "org/project#100"},
+                        web_url="https://gitlab.com/org/project/-/issues/100",
+                    )
+                ],
+                [100],
+            ),
+        ],
+        ids=["no-links", "blocking-link"],
+    )
+    def test_get_normal_issue_cross_links(
+        self, links: list[SimpleNamespace], expected_blocked_iids: list[int]
+    ) -> None:
+        # Only the REST links are read; the spec_set lists make any other issue access fail
+        mock_issue = Mock(spec_set=["iid", "links"], iid=42, links=Mock(spec_set=["list"]))
+        mock_issue.links.list.return_value = links
 
         result = get_normal_issue_cross_links(mock_issue, "org/project")
 
+        # Same-project blocking links become issue dependencies, not cross-link text
         assert result.cross_links_text == ""
-        assert result.blocked_issue_iids == []
-
-    def test_categorizes_blocking_links(self) -> None:
-        mock_issue = Mock()
-        mock_issue.iid = 42
+        assert result.blocked_issue_iids == expected_blocked_iids
 
-        mock_link = Mock()
-        mock_link.link_type = "blocks"
-        mock_link.iid = 100
-        mock_link.title = "Blocked issue"
-        mock_link.references = {"full": "org/project#100"}
-        mock_link.web_url = "https://gitlab.com/org/project/-/issues/100"
-        mock_issue.links.list.return_value = [mock_link]
 
+@pytest.mark.unit
+class TestGetWorkItemChildren:
+    @pytest.mark.parametrize(
+        ("children", "expected"),
+        [
+            ([], []),
+            (
+                [
+                    {
+                        "iid": "100",
+                        "title": "Child task",
+                        "state": "opened",
+                        "workItemType": {"name": "Task"},
+                        "webUrl": "https://gitlab.com/org/proj/-/issues/100",
+                    }
+                ],
+                [100],
+            ),
+        ],
+        ids=["no-children", "one-child"],
+    )
+    def test_get_work_item_children(self, children: list[dict[str, Any]], expected: list[int]) -> None:
         mock_graphql = Mock()
-        mock_graphql.execute.return_value = {"namespace": {"workItem": {"widgets": []}}}
-
-        result = get_normal_issue_cross_links(mock_issue, "org/project")
-
-        assert len(result.blocked_issue_iids) == 1
-        assert result.blocked_issue_iids[0] == 100
+        mock_graphql.execute.return_value = {
+            "namespace": {
+                "workItem": {
+                    "iid": "42",
+                    "widgets": [{"type": "HIERARCHY", "children": {"nodes": children}}],
+                }
+            }
+        }
+
+        assert get_work_item_children(mock_graphql, "org/project", 42) == expected
@@ -13,9 +13,8 @@ Test structure:
 """
 
 import os
-import random
 import re
-import string
+import secrets
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -31,13 +30,20 @@ from gitlab_to_github_migrator import gitlab_utils as glu
 if TYPE_CHECKING:
     from collections.abc import Generator, Sequence
 
+# GitLab upload reference (/uploads/<32-hex secret>/<filename>) and migrated GitHub release asset URL
+_GITLAB_ATTACHMENT_RE = re.compile(r"/uploads/[a-f0-9]{32}/[^)\s]+")
+_GITHUB_ASSET_RE = re.compile(r"github\.com/.*/releases/download/")
+
+# Core GitHub API requests that must be left before starting a full migration
+_MIN_GITHUB_RATE_BUDGET = 200
+
 
 def _generate_repo_name(test_type: str = "generic") -> str:
     """Generate a unique test repository name.
 
     Format: gl2ghmigr-<test_type>-test-<hash>
     """
-    random_suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    random_suffix = secrets.token_hex(4)
     return f"gl2ghmigr-{test_type}-test-{random_suffix}"
 
 
@@ -209,6 +215,17 @@ def _create_label_translations(
     return label_translations, expected_translations
 
 
+@pytest.fixture(scope="module")
+def github_rate_budget(github_client: Github) -> None:
+    """Skip when too few GitHub API requests are left to complete a migration."""
+    # Running out of API budget halfway would leave a partially migrated repository and fail every test
+    core_rate = github_client.get_rate_limit().resources.core
+    if core_rate.remaining < _MIN_GITHUB_RATE_BUDGET:
+        pytest.skip(
+            f"Insufficient GitHub API budget: {core_rate.remaining} requests left, resets at {core_rate.reset}"
+        )
+
+
 @pytest.fixture(scope="class")
 def migration_result(
     gitlab_token: str | None,
@@ -249,6 +266,7 @@ def migration_result(
 
 
 @pytest.mark.integration
+@pytest.mark.usefixtures("github_rate_budget")
 class TestFullMigration:
     """End-to-end migration tests split by aspect."""
 
@@ -537,13 +555,11 @@ class TestFullMigration:
         repo_path = migration_result.repo_path
 
         # Find issues with attachments
-        attachment_pattern = r"/uploads/[a-f0-9]{32}/[^)\s]+"
-        source_issues_with_attachments = []
-        for source_issue in gitlab_issues:
-            if source_issue.description:
-                attachments = re.findall(attachment_pattern, source_issue.description)
-                if attachments:
-                    source_issues_with_attachments.append(source_issue)
+        source_issues_with_attachments = [
+            source_issue
+            for source_issue in gitlab_issues
+            if source_issue.description and _GITLAB_ATTACHMENT_RE.search(source_issue.description)
+        ]
 
         if not source_issues_with_attachments:
             pytest.skip("No attachments found in source project issues")
@@ -553,8 +569,8 @@ class TestFullMigration:
             github_issue = github_repo.get_issue(source_issue.iid)
             if github_issue.body:
                 # GitLab URLs should be replaced with GitHub release asset URLs
-                remaining_gitlab_urls = re.findall(attachment_pattern, github_issue.body)
-                github_urls = re.findall(r"github\.com/.*/releases/download/", github_issue.body)
+                remaining_gitlab_urls = _GITLAB_ATTACHMENT_RE.findall(github_issue.body)
+                github_urls = _GITHUB_ASSET_RE.findall(github_issue.body)
                 assert len(remaining_gitlab_urls) == 0 or len(github_urls) > 0, (
                     f"Issue #{source_issue.iid}: attachments not migrated"
                 )
@@ -11,29 +11,28 @@ from gitlab_to_github_migrator.issue_builder import build_issue_body, format_tim
 
 @pytest.mark.unit
 class TestFormatTimestamp:
-    def test_format_with_z_suffix(self) -> None:
-        result = format_timestamp("2024-01-15T10:30:45.123Z")
-        assert result == "2024-01-15 10:30:45Z"
-
-    def test_format_with_utc_offset(self) -> None:
-        result = format_timestamp("2024-01-15T10:30:45.123456+00:00")
-        assert result == "2024-01-15 10:30:45Z"
-
-    def test_format_without_microseconds(self) -> None:
+    @pytest.mark.parametrize(
+        ("timestamp", "expected"),
+        [
+            ("2024-01-15T10:30:45.123Z", "2024-01-15 10:30:45Z"),
+            ("2024-01-15T10:30:45.123456+00:00", "2024-01-15 10:30:45Z"),
+            ("2024-01-15T10:30:45Z", "2024-01-15 10:30:45Z"),
+            ("2024-01-15T10:30:45+05:30", "2024-01-15 10:30:45+05:30"),
+            ("2024-01-15T10:30:45.123", "2024-01-15 10:30:45"),
+            ("", ""),
+            ("invalid-timestamp", "invalid-timestamp"),
+        ],
+        ids=["z-suffix", "utc-offset", "no-microseconds", "non-utc", "no-timezone", "empty", "invalid"],
+    )
+    def test_format_timestamp(self, timestamp: str, expected: str) -> None:
+        assert format_timestamp(timestamp) == expected
+
+    def test_repeated_timestamps_are_cached(self) -> None:
+        format_timestamp.cache_clear()
+        format_timestamp("2024-01-15T10:30:45Z")
         result = format_timestamp("2024-01-15T10:30:45Z")
         assert result == "2024-01-15 10:30:45Z"
-
-    def test_format_with_non_utc_timezone(self) -> None:
-        result = format_timestamp("2024-01-15T10:30:45+05:30")
-        assert result == "2024-01-15 10:30:45+05:30"
-
-    def test_empty_string_returns_as_is(self) -> None:
-        result = format_timestamp("")
-        assert result == ""
-
-    def test_invalid_format_returns_original(self) -> None:
-        result = format_timestamp("invalid-timestamp")
-        assert result == "invalid-timestamp"
+        assert format_timestamp.cache_info().hits == 1
 
 
 @pytest.mark.unit
@@ -1,21 +1,24 @@
-from unittest.mock import Mock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 from github import GithubException
 
 from gitlab_to_github_migrator.labels import LabelTranslator, migrate_labels
 
+_LABEL_ALREADY_EXISTS = GithubException(
+    422,
+    {"message": "Validation Failed", "errors": [{"resource": "Label", "code": "already_exists"}]},
+    headers={},
+)
+
 
 @pytest.mark.unit
 class TestMigrateLabels:
     """Test migrate_labels function."""
 
-    def _make_gitlab_label(self, name: str, color: str = "#ff0000", description: str = "") -> Mock:
-        label = Mock()
-        label.name = name
-        label.color = color
-        label.description = description
-        return label
+    def _make_gitlab_label(self, name: str, color: str = "#ff0000", description: str = "") -> SimpleNamespace:
+        return SimpleNamespace(name=name, color=color, description=description)
 
     def test_already_exists_error_is_handled(self) -> None:
         """When create_label raises 422 already_exists, use the existing label instead of crashing."""
@@ -29,16 +32,10 @@ class TestMigrateLabels:
         github_repo.get_labels.return_value = []
 
         # create_label raises 422 "already_exists" (default label appeared between get and create)
-        github_repo.create_label.side_effect = GithubException(
-            422,
-            {"message": "Validation Failed", "errors": [{"resource": "Label", "code": "already_exists"}]},
-            headers={},
-        )
+        github_repo.create_label.side_effect = _LABEL_ALREADY_EXISTS
 
         # After the error, get_label fetches the existing label
-        existing_label = Mock()
-        existing_label.name = "bug"
-        github_repo.get_label.return_value = existing_label
+        github_repo.get_label.return_value = SimpleNamespace(name="bug")
 
         result = migrate_labels(gitlab_project, github_repo)
 
@@ -49,25 +46,39 @@ class TestMigrateLabels:
 class TestLabelTranslator:
     """Test label translation functionality."""
 
-    def test_simple_translation(self) -> None:
-        translator = LabelTranslator(["p_high:priority: high", "bug:defect"])
-        assert translator.translate("p_high") == "priority: high"
-        assert translator.translate("bug") == "defect"
-        assert translator.translate("unknown") == "unknown"
-
-    def test_wildcard_translation(self) -> None:
-        translator = LabelTranslator(["p_*:priority: *", "status_*:status: *"])
-        assert translator.translate("p_high") == "priority: high"
-        assert translator.translate("p_low") == "priority: low"
-        assert translator.translate("status_open") == "status: open"
-        assert translator.translate("unmatched") == "unmatched"
+    @pytest.mark.parametrize(
+        ("patterns", "label", "expected"),
+        [
+            (["p_high:priority: high", "bug:defect"], "p_high", "priority: high"),
+            (["p_high:priority: high", "bug:defect"], "bug", "defect"),
+            (["p_high:priority: high", "bug:defect"], "unknown", "unknown"),
+            (["p_*:priority: *", "status_*:status: *"], "p_high", "priority: high"),
+            (["p_*:priority: *", "status_*:status: *"], "p_low", "priority: low"),
+            (["p_*:priority: *", "status_*:status: *"], "status_open", "status: open"),
+            (["p_*:priority: *", "status_*:status: *"], "unmatched", "unmatched"),
+            (["p_*:priority: *", "comp_*:component: *", "bug:defect"], "p_critical", "priority: critical"),
+            (["p_*:priority: *", "comp_*:component: *", "bug:defect"], "comp_ui", "component: ui"),
+            (["p_*:priority: *", "comp_*:component: *", "bug:defect"], "bug", "defect"),
+            (["p_*:priority: *", "p_high:urgent"], "p_high", "priority: high"),
+            (["p_high:urgent", "p_*:priority: *"], "p_high", "urgent"),
+            (["v1.*:version *"], "v1.2", "version 2"),
+            (["v1.*:version *"], "v102", "v102"),
+            (["c++:cpp"], "c++", "cpp"),
+            (["*-*:* and rest"], "a-b-c", "a-b and rest"),
+        ],
+    )
+    def test_translate(self, patterns: list[str], label: str, expected: str) -> None:
+        translator = LabelTranslator(patterns)
+        assert translator.translate(label) == expected
+
+    def test_translation_is_memoized(self) -> None:
+        translator = LabelTranslator(["p_*:priority: *"])
+        with patch.object(translator, "_translate_uncached", wraps=translator._translate_uncached) as uncached:
+            results = {translator.translate("p_high") for _ in range(1000)}
+
+        assert results == {"priority: high"}
+        uncached.assert_called_once_with("p_high")
 
     def test_invalid_pattern(self) -> None:
         with pytest.raises(ValueError, match="Invalid pattern format"):
             LabelTranslator(["invalid_pattern"])
-
-    def test_multiple_patterns(self) -> None:
-        translator = LabelTranslator(["p_*:priority: *", "comp_*:component: *", "bug:defect"])
-        assert translator.translate("p_critical") == "priority: critical"
-        assert translator.translate("comp_ui") == "component: ui"
-        assert translator.translate("bug") == "defect"